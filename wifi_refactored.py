@@ -4,27 +4,58 @@ WiFi Auto-Connector - Optimized Version
 Automated WiFi connection with captive portal login, MAC spoofing, and hotspot sharing
 """
 
+from __future__ import annotations
+
 import atexit
+import base64
 import ctypes
+import functools
 import logging
 import os
+import queue
+import random
+import re
+import shutil
 import signal
+import socket
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
 from enum import Enum
-from pathlib import Path
-from typing import List, Optional
-import requests
-from selenium import webdriver
-from selenium.webdriver.edge.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+# Only the exception classes are needed at import time (retry decorators); they don't pull in the
+# webdriver stack. requests and selenium.webdriver are imported where first used so that early exits
+# such as a configuration error don't pay for them.
+from selenium.common.exceptions import JavascriptException, TimeoutException, WebDriverException
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+try:
+    import psutil  # Optional: in-process process enumeration/termination
+except ImportError:
+    psutil = None
+
+try:
+    import winreg  # Windows only: native MAC change without the spoof-mac tool
+except ImportError:
+    winreg = None
+
+try:
+    # Optional: direct WinRT calls for hotspot control instead of PowerShell
+    from winsdk.windows.networking.connectivity import NetworkInformation
+    from winsdk.windows.networking.networkoperators import (
+        NetworkOperatorTetheringManager, TetheringOperationalState, TetheringOperationStatus
+    )
+except ImportError:
+    NetworkInformation = None
+    NetworkOperatorTetheringManager = None
 
 # ================================= CONSTANTS =================================
 
@@ -32,32 +63,54 @@ class Constants:
     """Application timing and configuration constants optimized for captive portal environments"""
     
     # Internet connectivity verification
-    CONNECTIVITY_TEST_ENDPOINTS = ["https://www.google.com", "https://www.cloudflare.com"]
-    CONNECTIVITY_CHECK_TIMEOUT = 10  # Balanced timeout for captive portal detection
-    CONNECTIVITY_CACHE_DURATION = 10  # Cache results to avoid excessive network calls
+    CONNECTIVITY_TEST_ENDPOINTS = ["http://www.gstatic.com/generate_204", "http://cp.cloudflare.com/generate_204"]
+    CONNECTIVITY_SUCCESS_STATUS = 204  # Captive portals answer these endpoints with a redirect or login page instead
+    CONNECTIVITY_CHECK_TIMEOUT = 3  # Probes go to a pinned IP, so no DNS lookup eats into this budget
+    CONNECTIVITY_DOH_RESOLVER_URL = "https://1.1.1.1/dns-query"  # Resolves probe hosts past captive DNS interception
+    CONNECTIVITY_DOH_TIMEOUT = 2
+    CONNECTIVITY_DOH_MIN_TTL = 30  # Floor for pin lifetimes so very short record TTLs don't mean a lookup per check
+    CONNECTIVITY_DOH_FAILURE_CACHE_DURATION = 60  # Don't retry an unreachable DoH resolver on every check
+    # The probe hosts on the probes' own port - networks that block public DNS still allow these
+    CONNECTIVITY_PRECHECK_ADDRESSES = [("www.gstatic.com", 80), ("cp.cloudflare.com", 80)]
+    CONNECTIVITY_PRECHECK_TIMEOUT = 1.5  # Fail fast when there is no route at all
+    CONNECTIVITY_POSITIVE_CACHE_DURATION = 60  # Stable connections don't need re-probing every cycle
+    CONNECTIVITY_NEGATIVE_CACHE_DURATION = 2  # Short so a freshly restored network is noticed quickly
     
     # Browser automation timings (tuned for captive portal response times)
     SELENIUM_OPERATION_TIMEOUT = 40  # Max time for captive portal page loads
-    CAPTIVE_PORTAL_POPUP_TIMEOUT = 15  # Time to wait for dismissible popups
+    CAPTIVE_PORTAL_POPUP_TIMEOUT = 3  # The popup is rendered with the page or not at all
+    SELENIUM_POLL_FREQUENCY = 0.1  # In-page poll interval while waiting for portal elements
     PORTAL_INTERACTION_DELAY = 6  # Required delay between captive portal button clicks
-    POST_LOGIN_VERIFICATION_WAIT = 10  # Time to wait after login before connectivity check
+    POST_LOGIN_VERIFICATION_WAIT = 10  # Max time to wait for the portal to react after login
+    PORTAL_REQUEST_TIMEOUT = 10  # Per-request timeout for direct HTTP portal logins
+    BROWSER_POOL_WAIT_INTERVAL = 1  # Re-check pool capacity this often while waiting for an idle browser
     
     # System process management
     SUBPROCESS_EXECUTION_TIMEOUT = 30  # Max time for system commands
     PRIVILEGE_CHECK_TIMEOUT = 5  # Quick timeout for admin rights verification
     NETWORK_ADAPTER_RESET_TIME = 15  # Time needed for MAC change to take effect
+    ADAPTER_READY_MIN_WAIT = 2  # Let the adapter drop its old lease before polling for readiness
+    ADAPTER_READY_POLL_INTERVAL = 0.5  # Poll rate while waiting for the adapter to come back
+    NETWORK_ADAPTER_CLASS_KEY = r"SYSTEM\CurrentControlSet\Control\Class\{4d36e972-e325-11ce-bfc1-08002be10318}"
+    NETWORK_CONNECTION_KEY = r"SYSTEM\CurrentControlSet\Control\Network\{4D36E972-E325-11CE-BFC1-08002BE10318}"
     
     # Mobile hotspot management (Windows API limitations)
     HOTSPOT_STATUS_CACHE_DURATION = 10  # Cache to avoid frequent Windows API calls
     HOTSPOT_STATE_TRANSITION_TIME = 3  # Time for hotspot enable/disable operations
+    HOTSPOT_STATE_RESYNC_INTERVAL = 60  # Re-read the real state this often (Windows may stop an idle hotspot)
     
     # Failure recovery strategy
     MAX_OPERATION_RETRIES = 3  # Retry limit for recoverable operations
-    PROGRESSIVE_RETRY_DELAY = 2  # Base delay that increases with each retry
+    PROGRESSIVE_RETRY_DELAY = 2  # Base delay that doubles with each retry
+    MAX_RETRY_DELAY = 30  # Upper bound for a single backoff sleep
+    SHUTDOWN_WAIT_SLICE = 0.5  # Long waits are split so Ctrl+C is handled promptly on Windows
 
 # ================================= CONFIGURATION =================================
 
-@dataclass
+# Placeholder markers left in selectors that still need customizing
+_PLACEHOLDER_RE = re.compile(r"DÁN_XPATH|PLACEHOLDER|CHANGE_ME")
+
+@dataclass(frozen=True)
 class WifiConfig:
     """WiFi Auto-Connector configuration with captive portal and hotspot management settings"""
     # Browser automation setup
@@ -68,11 +121,25 @@ class WifiConfig:
     xpath_button_1: str = "/html/body/main/div[1]/div[3]/div/div/div/div[1]/button"
     xpath_button_2: str = "//*[@id='connectToInternet']"
     
+    # Optional faster native ID/CSS lookups tried before the XPath selectors above. Opt-in: only
+    # fill these in for the same portal the XPaths were taken from, or a stale one may click the wrong element
+    id_popup_remind_later: str = ""  # e.g. "remind-me"
+    css_button_1: str = ""
+    id_button_2: str = ""  # e.g. "connectToInternet"
+    
+    # Direct HTTP login: (url, form data) POSTs replayed in order, as captured from the portal's
+    # network traffic in DevTools. Leave empty to log in through the browser only.
+    portal_login_requests: Tuple[Tuple[str, Dict[str, str]], ...] = ()
+    use_browser_fallback: bool = True  # Fall back to browser automation if the direct login fails
+    
     # Connection monitoring and recovery behavior
-    connectivity_check_interval: int = 10  # Seconds between connection status checks
+    connectivity_check_interval: int = 10  # Seconds between connection status checks (while recovering)
+    max_connectivity_check_interval: int = 120  # Interval doubles up to this while the connection stays up
     connection_failures_before_mac_reset: int = 3  # Failed attempts before trying MAC randomization
     mac_reset_cooldown_seconds: int = 300  # Minimum time between MAC address changes
-    network_adapter_stabilization_time: int = 15  # Wait time after MAC change for network stack reset
+    network_adapter_stabilization_time: int = 15  # Max wait after MAC change for network stack reset
+    wifi_adapter_name: str = "Wi-Fi"  # Adapter polled for readiness after a MAC change
+    browser_pool_size: int = 1  # Pre-warmed Edge instances kept for portal logins (capped at CPU count)
     
     # Feature toggles for advanced functionality
     mac_spoofing_enabled: bool = True  # Randomize MAC to bypass device-based restrictions
@@ -80,32 +147,41 @@ class WifiConfig:
     auto_enable_hotspot_on_connection: bool = True  # Start hotspot when internet is available
     persistent_hotspot_mode: bool = True  # Keep hotspot running continuously
     disable_hotspot_on_connection_loss: bool = True  # Stop hotspot when WiFi fails
+    tcp_precheck_enabled: bool = True  # Quick TCP reachability test of the probe hosts before the HTTP probes
     
     def validate(self) -> None:
         """Validate configuration and check for common setup issues"""
-        if not Path(self.edge_driver_path).exists():
+        if not self.portal_login_requests and not self.use_browser_fallback:
+            raise ConfigurationError("portal_login_requests is empty and use_browser_fallback is disabled - no way to log in")
+        
+        # The driver is only needed when the browser may be used
+        uses_browser = not self.portal_login_requests or self.use_browser_fallback
+        if uses_browser and not os.path.exists(self.edge_driver_path):
             raise ConfigurationError(f"Edge WebDriver not found at: {self.edge_driver_path}")
         
-        # Detect placeholder values that need customization
-        placeholder_indicators = ["DÁN_XPATH", "PLACEHOLDER", "CHANGE_ME"]
-        xpath_fields = [self.xpath_button_1, self.xpath_button_2, self.xpath_popup_remind_later]
+        if self.max_connectivity_check_interval < self.connectivity_check_interval:
+            raise ConfigurationError("max_connectivity_check_interval must not be below connectivity_check_interval")
         
-        for placeholder in placeholder_indicators:
-            for xpath in xpath_fields:
-                if placeholder in xpath:
-                    raise ConfigurationError(f"XPath selector contains placeholder '{placeholder}' - please customize for your captive portal")
+        # Detect placeholder values that need customization
+        for selector in (self.xpath_button_1, self.xpath_button_2, self.xpath_popup_remind_later,
+                         self.css_button_1, self.id_button_2, self.id_popup_remind_later):
+            placeholder_match = _PLACEHOLDER_RE.search(selector)
+            if placeholder_match:
+                raise ConfigurationError(f"Selector contains placeholder '{placeholder_match.group()}' - please customize for your captive portal")
+
+# Probe order for the Edge WebDriver - computed once at import
+_EDGE_DRIVER_CANDIDATE_PATHS = (
+    os.path.join(os.getcwd(), "msedgedriver.exe"),  # Current directory
+    os.path.join(os.path.expanduser("~"), "Desktop", "Edge_Driver", "msedgedriver.exe"),  # User desktop
+    os.path.join(os.path.dirname(sys.executable), "Scripts", "msedgedriver.exe"),  # Python Scripts
+    "msedgedriver.exe"  # System PATH
+)
 
+@functools.lru_cache(maxsize=1)
 def _find_edge_driver() -> str:
     """Auto-detect Microsoft Edge WebDriver location across common installation paths"""
-    candidate_paths = [
-        os.path.join(os.getcwd(), "msedgedriver.exe"),  # Current directory
-        os.path.join(os.path.expanduser("~"), "Desktop", "Edge_Driver", "msedgedriver.exe"),  # User desktop
-        os.path.join(os.path.dirname(sys.executable), "Scripts", "msedgedriver.exe"),  # Python Scripts
-        "msedgedriver.exe"  # System PATH
-    ]
-    
-    for candidate_path in candidate_paths:
-        if Path(candidate_path).exists():
+    for candidate_path in _EDGE_DRIVER_CANDIDATE_PATHS:
+        if os.path.exists(candidate_path):
             return candidate_path
     
     # Return default path as fallback (user must install driver here)
@@ -167,13 +243,42 @@ class ColoredFormatter(logging.Formatter):
     }
     RESET = '\033[0m'
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Colored level names built once instead of per record
+        self._colored_levels = {level: f"{color}{level}{self.RESET}" for level, color in self.COLORS.items()}
+    
     def format(self, record):
-        color = self.COLORS.get(record.levelname, self.RESET)
-        record.levelname = f"{color}{record.levelname}{self.RESET}"
-        return super().format(record)
+        original_levelname = record.levelname
+        record.levelname = self._colored_levels.get(original_levelname, original_levelname)
+        try:
+            return super().format(record)
+        finally:
+            # Records are shared between handlers - don't leak color codes into the others
+            record.levelname = original_levelname
+
+@functools.lru_cache(maxsize=1)
+def _enable_virtual_terminal_processing() -> bool:
+    """Enable ANSI escape sequence handling in the Windows console once; True if escapes will render"""
+    if os.name != 'nt':
+        return True
+    
+    try:
+        kernel32 = ctypes.windll.kernel32
+        stdout_handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        console_mode = ctypes.c_uint32()
+        if kernel32.GetConsoleMode(stdout_handle, ctypes.byref(console_mode)):
+            # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+            return bool(kernel32.SetConsoleMode(stdout_handle, console_mode.value | 0x0004))
+    except Exception:
+        pass
+    return False  # Older consoles would just show raw escape codes
 
 def setup_logging() -> logging.Logger:
     """Setup application logging with colored output for better readability"""
+    # Colored levels and the status screen clear both rely on ANSI escapes
+    _enable_virtual_terminal_processing()
+    
     logger = logging.getLogger('wifi_connector')
     logger.setLevel(logging.INFO)
     
@@ -192,32 +297,220 @@ def setup_logging() -> logging.Logger:
 
 # ================================= UTILITIES =================================
 
-def retry_on_failure(retries: int = Constants.MAX_OPERATION_RETRIES, delay: float = Constants.PROGRESSIVE_RETRY_DELAY):
-    """Decorator that retries failed operations with progressive backoff strategy"""
+def retry_on_failure(retries: int = Constants.MAX_OPERATION_RETRIES, delay: float = Constants.PROGRESSIVE_RETRY_DELAY,
+                     retry_on: tuple = (NetworkError, WebDriverException)):
+    """Decorator that retries recoverable failures with exponential backoff and jitter"""
     def decorator(func):
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            last_exception = None
             for attempt in range(retries):
                 try:
                     return func(*args, **kwargs)
-                except Exception as e:
-                    last_exception = e
-                    if attempt < retries - 1:
-                        # Progressive delay: 2s, 4s, 6s for attempts 1, 2, 3
-                        time.sleep(delay * (attempt + 1))
-                    continue
-            raise last_exception
+                except retry_on:
+                    # Out of attempts - no point sleeping before re-raising
+                    if attempt == retries - 1:
+                        raise
+                    # Exponential delay: 2s, 4s, 8s... plus up to one base delay of jitter, capped
+                    backoff = delay * (2 ** attempt) + random.uniform(0, delay)
+                    time.sleep(min(backoff, Constants.MAX_RETRY_DELAY))
         return wrapper
     return decorator
 
-@contextmanager
-def suppress_subprocess_output():
-    """Context manager to suppress subprocess output"""
-    devnull = open(os.devnull, 'w')
+@functools.lru_cache(maxsize=1)
+def _is_admin() -> bool:
+    """Check administrator privileges once - the process token cannot change while running"""
     try:
-        yield devnull
-    finally:
-        devnull.close()
+        return bool(ctypes.windll.shell32.IsUserAnAdmin())
+    except:
+        return False
+
+def _spoof_mac_candidate_paths() -> tuple:
+    """Build the spoof-mac probe list across common Python installation paths"""
+    python_version = f"Python{sys.version_info.major}{sys.version_info.minor}"
+    candidate_paths = [
+        os.path.join(os.path.dirname(sys.executable), "Scripts", "spoof-mac.exe")  # Python Scripts (most common)
+    ]
+    
+    appdata_path = os.getenv('APPDATA')
+    if appdata_path:
+        user_scripts_dir = os.path.join(appdata_path, "Python", python_version, "Scripts")
+        candidate_paths.append(os.path.join(user_scripts_dir, "spoof-mac.exe"))  # User-specific installation
+        candidate_paths.append(os.path.join(user_scripts_dir, "spoof-mac.py"))  # Development installation
+    
+    return tuple(candidate_paths)
+
+_SPOOF_MAC_CANDIDATE_PATHS = _spoof_mac_candidate_paths()
+
+@functools.lru_cache(maxsize=1)
+def _find_spoof_mac_tool() -> Optional[str]:
+    """Locate the spoof-mac executable once per process"""
+    # PATH covers venv, conda and pipx installs; the fixed locations catch Scripts dirs missing from PATH
+    tool_on_path = shutil.which("spoof-mac")
+    if tool_on_path:
+        return tool_on_path
+    for candidate_path in _SPOOF_MAC_CANDIDATE_PATHS:
+        if os.path.exists(candidate_path):
+            return candidate_path
+    return None
+
+# Waits inside the page for the first clickable match (ID/CSS first, XPath fallback) and clicks it,
+# so a whole wait costs one WebDriver round trip. Resolves with the pre-click URL, or null on timeout.
+_CLICK_WHEN_READY_SCRIPT = """
+const [fastBy, fastValue, xpath, timeoutMs, notBeforeMs, pollMs, done] = arguments;
+const started = Date.now();
+const isClickable = el => !!el && !el.disabled && el.getClientRects().length > 0
+    && getComputedStyle(el).visibility !== 'hidden';
+const findTarget = () => {
+    let el = null;
+    try {
+        if (fastValue) el = fastBy === 'id' ? document.getElementById(fastValue) : document.querySelector(fastValue);
+    } catch (e) {
+        el = null;  // Invalid CSS selector - the XPath below still applies
+    }
+    if (isClickable(el)) return el;
+    try {
+        el = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    } catch (e) {
+        el = null;  // Document still being replaced - try again on the next poll
+    }
+    return isClickable(el) ? el : null;
+};
+(function poll() {
+    const elapsed = Date.now() - started;
+    const target = findTarget();
+    if (target && elapsed >= notBeforeMs) {
+        const preClickUrl = location.href;
+        target.click();
+        done(preClickUrl);
+    } else if (elapsed >= timeoutMs) {
+        done(null);
+    } else {
+        setTimeout(poll, pollMs);
+    }
+})();
+"""
+
+# Persistent session reads scripts from stdin; -NonInteractive makes a stray prompt fail instead of hang
+_POWERSHELL_COMMAND = ("powershell", "-NoProfile", "-NoLogo", "-NonInteractive", "-Command", "-")
+
+def _hidden_console_popen_options() -> dict:
+    """Popen options that stop console helpers from flashing a window (Windows only)"""
+    if sys.platform != "win32":
+        return {}
+    startupinfo = subprocess.STARTUPINFO()  # Popen copies it, so one instance can be shared
+    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    startupinfo.wShowWindow = subprocess.SW_HIDE
+    return {"startupinfo": startupinfo, "creationflags": subprocess.CREATE_NO_WINDOW}
+
+_HIDDEN_CONSOLE_POPEN_OPTIONS = _hidden_console_popen_options()
+
+class PowerShellSession:
+    """Long-lived PowerShell process that runs scripts over stdin to avoid per-call startup cost"""
+    
+    END_OF_OUTPUT_SENTINEL = "<<END>>"
+    
+    def __init__(self, logger: logging.Logger, init_script: str = ""):
+        self.logger = logger
+        self._init_script = init_script
+        self._process: Optional[subprocess.Popen] = None
+        self._output_lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+    
+    def execute(self, script: str, timeout: float) -> str:
+        """Run a script in the persistent session and return its output"""
+        with self._lock:
+            self._ensure_started()
+            self._send_script(script)
+            return self._read_until_sentinel(timeout)
+    
+    def close(self) -> None:
+        """Ask the PowerShell process to exit, killing it outright if a call is still running"""
+        if not self._lock.acquire(blocking=False):
+            # Don't hold up shutdown behind a slow call - its reader sees EOF and the call fails
+            process = self._process
+            if process is not None:
+                process.kill()
+            return
+        try:
+            self._terminate()
+        finally:
+            self._lock.release()
+    
+    def _ensure_started(self) -> None:
+        """Start PowerShell (and run the init script) if it isn't already running"""
+        if self._process is not None and self._process.poll() is None:
+            return
+        
+        self._process = subprocess.Popen(
+            list(_POWERSHELL_COMMAND),
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, bufsize=1, **_HIDDEN_CONSOLE_POPEN_OPTIONS
+        )
+        self._output_lines = queue.Queue()
+        threading.Thread(
+            target=self._pump_output, args=(self._process, self._output_lines),
+            name="powershell-reader", daemon=True
+        ).start()
+        
+        if self._init_script:
+            self._send_script(self._init_script)
+            init_output = self._read_until_sentinel(Constants.SUBPROCESS_EXECUTION_TIMEOUT)
+            # Later calls would only fail with "term not recognized" - surface the real cause once
+            for line in init_output.splitlines():
+                if line.startswith("ERROR:"):
+                    self.logger.error(f"PowerShell session initialization failed: {line[len('ERROR:'):].strip()}")
+    
+    def _send_script(self, script: str) -> None:
+        """Write a script as a single line so multi-line blocks parse in one piece"""
+        # Interactive stdin mode executes line by line; base64 keeps the script intact
+        encoded_script = base64.b64encode(script.encode('utf-8')).decode('ascii')
+        command_line = (
+            f"try {{ Invoke-Expression ([Text.Encoding]::UTF8.GetString([Convert]::FromBase64String('{encoded_script}'))) }} "
+            f"catch {{ Write-Output \"ERROR: $($_.Exception.Message)\" }} "
+            f"finally {{ Write-Output '{self.END_OF_OUTPUT_SENTINEL}' }}\n"
+        )
+        self._process.stdin.write(command_line)
+        self._process.stdin.flush()
+    
+    def _read_until_sentinel(self, timeout: float) -> str:
+        """Collect output lines until the sentinel, restarting the session on timeout"""
+        deadline = time.monotonic() + timeout
+        output_lines = []
+        
+        while True:
+            try:
+                line = self._output_lines.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                self._terminate()
+                raise subprocess.TimeoutExpired("powershell", timeout)
+            
+            if line is None:
+                self._terminate()
+                raise subprocess.SubprocessError("PowerShell session exited unexpectedly")
+            if line.strip() == self.END_OF_OUTPUT_SENTINEL:
+                return "\n".join(output_lines)
+            output_lines.append(line.rstrip("\r\n"))
+    
+    def _terminate(self) -> None:
+        """Stop the PowerShell process; the next call starts a fresh one"""
+        process, self._process = self._process, None
+        if process is None or process.poll() is not None:
+            return
+        
+        try:
+            process.stdin.write("exit\n")
+            process.stdin.flush()
+            process.wait(timeout=2)
+        except Exception:
+            process.kill()
+    
+    @staticmethod
+    def _pump_output(process: subprocess.Popen, output_lines: "queue.Queue[Optional[str]]") -> None:
+        """Forward PowerShell stdout lines to the queue, ending with None on EOF"""
+        for line in process.stdout:
+            output_lines.put(line)
+        output_lines.put(None)
 
 # ================================= CORE MANAGERS =================================
 
@@ -227,48 +520,158 @@ class NetworkManager:
     def __init__(self, logger: logging.Logger, config: WifiConfig):
         self.logger = logger
         self.config = config
-        self._connectivity_cache_timestamp: Optional[datetime] = None
+        self._connectivity_cache_timestamp: Optional[float] = None
         self._cached_connectivity_status: Optional[bool] = None
+        self._connectivity_cache_ttl: int = 0
+        
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        # Persistent session keeps TCP connections alive between checks
+        self._session = requests.Session()
+        # One kept-alive connection per probe host; concurrent probes never wait on the pool,
+        # and retries are left to the next check rather than stacking up inside one
+        probe_adapter = HTTPAdapter(
+            pool_connections=len(Constants.CONNECTIVITY_TEST_ENDPOINTS),
+            pool_maxsize=len(Constants.CONNECTIVITY_TEST_ENDPOINTS),
+            max_retries=0
+        )
+        self._session.mount('http://', probe_adapter)
+        self._session.mount('https://', probe_adapter)
+        # Set once on the session instead of per probe; transparent proxies may still cache a 204
+        self._session.headers.update({'Cache-Control': 'no-cache', 'Pragma': 'no-cache'})
+        self._probe_executor = ThreadPoolExecutor(
+            max_workers=len(Constants.CONNECTIVITY_TEST_ENDPOINTS),
+            thread_name_prefix="connectivity-probe"
+        )
+        # Probe host -> (IP resolved over DoH, or None after a failed lookup; monotonic expiry).
+        # Kept in-process only; entries expire with the record TTL and are dropped when a probe fails.
+        self._pinned_addresses: Dict[str, Tuple[Optional[str], float]] = {}
     
     def verify_internet_connectivity(self) -> bool:
         """Check internet connectivity with caching to reduce network overhead"""
         # Return cached result if still valid
-        if (self._connectivity_cache_timestamp and 
-            datetime.now() - self._connectivity_cache_timestamp < timedelta(seconds=Constants.CONNECTIVITY_CACHE_DURATION)):
+        if (self._connectivity_cache_timestamp is not None and 
+            time.monotonic() - self._connectivity_cache_timestamp < self._connectivity_cache_ttl):
             return self._cached_connectivity_status or False
         
         self.logger.info("Verifying internet connectivity...")
         
-        # Test multiple endpoints for reliability
-        for test_endpoint in Constants.CONNECTIVITY_TEST_ENDPOINTS:
-            try:
-                response = requests.get(
-                    test_endpoint,
-                    timeout=Constants.CONNECTIVITY_CHECK_TIMEOUT,
-                    headers={'Cache-Control': 'no-cache', 'Pragma': 'no-cache'}  # Bypass any caching
-                )
-                
-                if response.status_code == 200:
-                    self._update_cache(True)
-                    self.logger.info("Internet connectivity confirmed")
-                    return True
-                    
-            except requests.RequestException:
-                continue  # Try next endpoint
+        # Cheap TCP pre-check - no route means no point in full HTTP probes
+        if self.config.tcp_precheck_enabled and not self._has_network_route():
+            self._update_cache(False)
+            self.logger.warning("No internet connectivity detected (no network route)")
+            return False
+        
+        # Probe all endpoints concurrently and accept the first success
+        pending_probes = [
+            self._probe_executor.submit(self._probe_endpoint, test_endpoint)
+            for test_endpoint in Constants.CONNECTIVITY_TEST_ENDPOINTS
+        ]
+        for completed_probe in as_completed(pending_probes):
+            if completed_probe.result():
+                # Drop probes that haven't started yet; running ones finish on their own timeout
+                for pending_probe in pending_probes:
+                    pending_probe.cancel()
+                self._update_cache(True)
+                self.logger.info("Internet connectivity confirmed")
+                return True
         
         self._update_cache(False)
         self.logger.warning("No internet connectivity detected")
         return False
     
-    def invalidate_connectivity_cache(self) -> None:
-        """Force fresh connectivity check on next verification"""
-        self._connectivity_cache_timestamp = None
-        self._cached_connectivity_status = None
+    def _has_network_route(self) -> bool:
+        """Open a plain TCP connection to a probe host to detect a dead link quickly"""
+        for host, port in Constants.CONNECTIVITY_PRECHECK_ADDRESSES:
+            # Prefer the pinned address so the pre-check doesn't depend on the local resolver either
+            address = (self._cached_probe_address(host) or host, port)
+            try:
+                with socket.create_connection(address, timeout=Constants.CONNECTIVITY_PRECHECK_TIMEOUT):
+                    return True
+            except socket.gaierror:
+                return True  # Name lookup failed, not the route - inconclusive, let the probes (and DoH) decide
+            except OSError:
+                continue  # Try next address
+        return False
+    
+    def _probe_endpoint(self, test_endpoint: str) -> bool:
+        """Send a bodyless HEAD probe and check for the expected 204 response"""
+        import requests
+        
+        endpoint_parts = urlsplit(test_endpoint)
+        pinned_address = self._resolve_probe_host(endpoint_parts.hostname)
+        request_options = dict(
+            params={'nocache': random.getrandbits(32)},  # Defeat intermediate HTTP caches
+            timeout=Constants.CONNECTIVITY_CHECK_TIMEOUT,
+            allow_redirects=False  # A portal redirect must not count as connectivity
+        )
+        if pinned_address:
+            # Address the pinned IP directly so a hijacked local resolver never sees the lookup
+            test_endpoint = endpoint_parts._replace(netloc=pinned_address).geturl()
+            request_options['headers'] = {'Host': endpoint_parts.hostname}
+        try:
+            response = self._session.head(test_endpoint, **request_options)
+            if response.status_code == 405:
+                # Endpoint refuses HEAD - GET it but stop after the status line and headers
+                with self._session.get(test_endpoint, stream=True, **request_options) as response:
+                    pass
+            probe_succeeded = response.status_code == Constants.CONNECTIVITY_SUCCESS_STATUS
+        except requests.RequestException:
+            probe_succeeded = False
+        if pinned_address and not probe_succeeded:
+            # The address may have gone stale or been reassigned - resolve again on the next check
+            self._pinned_addresses.pop(endpoint_parts.hostname, None)
+        return probe_succeeded
+    
+    def _cached_probe_address(self, hostname: str) -> Optional[str]:
+        """Return the pinned address for a probe host if one is cached and unexpired"""
+        pinned_address, expires_at = self._pinned_addresses.get(hostname, (None, 0.0))
+        return pinned_address if time.monotonic() < expires_at else None
+    
+    def _resolve_probe_host(self, hostname: str) -> Optional[str]:
+        """Return a DoH-resolved IPv4 address for a probe host, resolving it when the cached entry has expired"""
+        import requests
+        
+        if hostname in self._pinned_addresses:
+            pinned_address, expires_at = self._pinned_addresses[hostname]
+            if time.monotonic() < expires_at:
+                return pinned_address  # None while a recent lookup failure is cached
+        
+        failure_expiry = time.monotonic() + Constants.CONNECTIVITY_DOH_FAILURE_CACHE_DURATION
+        try:
+            response = self._session.get(
+                Constants.CONNECTIVITY_DOH_RESOLVER_URL,
+                params={'name': hostname, 'type': 'A'},
+                headers={'Accept': 'application/dns-json'},
+                timeout=Constants.CONNECTIVITY_DOH_TIMEOUT
+            )
+            answers = response.json().get('Answer', []) if response.ok else []
+        except (requests.RequestException, ValueError):
+            # Probe by hostname meanwhile; a blocked resolver shouldn't cost its timeout on every check
+            self._pinned_addresses[hostname] = (None, failure_expiry)
+            return None
+        for answer in answers:
+            if answer.get('type') == 1:  # A record
+                ttl = max(answer.get('TTL', 0), Constants.CONNECTIVITY_DOH_MIN_TTL)
+                self._pinned_addresses[hostname] = (answer['data'], time.monotonic() + ttl)
+                return answer['data']
+        self._pinned_addresses[hostname] = (None, failure_expiry)
+        return None
+    
+    def close(self) -> None:
+        """Stop the probe workers and close pooled HTTP connections"""
+        self._probe_executor.shutdown(wait=False, cancel_futures=True)
+        self._session.close()
     
     def _update_cache(self, connectivity_status: bool) -> None:
-        """Update connectivity cache with timestamp"""
-        self._connectivity_cache_timestamp = datetime.now()
+        """Update connectivity cache with timestamp and a TTL that depends on the outcome"""
+        self._connectivity_cache_timestamp = time.monotonic()
         self._cached_connectivity_status = connectivity_status
+        self._connectivity_cache_ttl = (
+            Constants.CONNECTIVITY_POSITIVE_CACHE_DURATION if connectivity_status
+            else Constants.CONNECTIVITY_NEGATIVE_CACHE_DURATION
+        )
 
 class MacAddressManager:
     """Manages network adapter MAC address randomization to bypass device-based restrictions"""
@@ -276,59 +679,50 @@ class MacAddressManager:
     def __init__(self, logger: logging.Logger, config: WifiConfig):
         self.logger = logger
         self.config = config
-        self._mac_spoofing_tool_path: Optional[str] = None
+        # Adapter registry key and tool presence are fixed for the process lifetime - resolve them once
+        self._adapter_registry_key = self._find_adapter_registry_key()
+        self._mac_spoofing_available = (
+            self._adapter_registry_key is not None or self.locate_mac_spoofing_tool() is not None
+        )
     
     def locate_mac_spoofing_tool(self) -> Optional[str]:
         """Locate spoof-mac executable across common Python installation paths"""
-        if self._mac_spoofing_tool_path:
-            return self._mac_spoofing_tool_path
-        
-        # Check Python Scripts directory (most common)
-        system_scripts_path = os.path.join(
-            os.path.dirname(sys.executable), "Scripts", "spoof-mac.exe"
-        )
-        if os.path.exists(system_scripts_path):
-            self._mac_spoofing_tool_path = system_scripts_path
-            return system_scripts_path
-        
-        # Check user-specific Python installation
-        try:
-            python_version = f"Python{sys.version_info.major}{sys.version_info.minor}"
-            user_scripts_path = os.path.join(
-                os.getenv('APPDATA'), "Python", python_version, "Scripts", "spoof-mac.exe"
-            )
-            if os.path.exists(user_scripts_path):
-                self._mac_spoofing_tool_path = user_scripts_path
-                return user_scripts_path
-        except Exception:
-            pass
-        
-        # Check for Python script version (development installation)
-        try:
-            user_python_script = os.path.join(
-                os.getenv('APPDATA'), "Python", 
-                f"Python{sys.version_info.major}{sys.version_info.minor}",
-                "Scripts", "spoof-mac.py"
-            )
-            if os.path.exists(user_python_script):
-                self._mac_spoofing_tool_path = user_python_script
-                return user_python_script
-        except Exception:
-            pass
-        
-        return None
+        return _find_spoof_mac_tool()
     
     def is_mac_spoofing_available(self) -> bool:
         """Check if MAC address spoofing capability is available"""
-        return self.locate_mac_spoofing_tool() is not None
+        return self._mac_spoofing_available
     
     def randomize_network_adapter_mac(self) -> bool:
         """Randomize WiFi adapter MAC address to bypass network device restrictions"""
-        spoofing_tool_path = self.locate_mac_spoofing_tool()
-        
-        if not spoofing_tool_path:
-            raise MacAddressError("spoof-mac tool not found. Install with: pip install spoof-mac")
+        spoofing_tool_path = None
+        if self._adapter_registry_key is None:
+            spoofing_tool_path = self.locate_mac_spoofing_tool()
+            if not spoofing_tool_path:
+                raise MacAddressError("spoof-mac tool not found. Install with: pip install spoof-mac")
         
+        try:
+            # Native registry + netsh route when running elevated, spoof-mac tool otherwise
+            if spoofing_tool_path is None:
+                self._randomize_mac_via_registry()
+            else:
+                self._randomize_mac_via_spoof_mac(spoofing_tool_path)
+            
+            self.logger.info("MAC address randomized successfully")
+            self.logger.info(f"Waiting up to {self.config.network_adapter_stabilization_time}s for network adapter reset...")
+            
+            # Critical: Network stack needs time to reinitialize with new MAC
+            self._wait_for_adapter_ready()
+            
+            return True
+            
+        except subprocess.CalledProcessError as e:
+            raise MacAddressError(f"MAC randomization failed: {e.stderr}")
+        except Exception as e:
+            raise MacAddressError(f"Unexpected MAC randomization error: {e}")
+    
+    def _randomize_mac_via_spoof_mac(self, spoofing_tool_path: str) -> None:
+        """Randomize the MAC through the external spoof-mac tool"""
         self.logger.info(f"Randomizing WiFi adapter MAC address using: {spoofing_tool_path}")
         
         # Construct command based on tool type
@@ -337,52 +731,375 @@ class MacAddressManager:
         else:
             command = [spoofing_tool_path, "randomize", "wi-fi"]
         
+        self.logger.debug(f"Executing: {' '.join(command)}")
+        subprocess.run(
+            command, 
+            check=True, 
+            stdout=subprocess.DEVNULL,  # Only stderr is reported on failure
+            stderr=subprocess.PIPE, 
+            text=True, 
+            timeout=30
+        )
+    
+    def _randomize_mac_via_registry(self) -> None:
+        """Write a random NetworkAddress for the adapter and restart it so the driver picks it up"""
+        new_mac_address = self._generate_random_mac()
+        self.logger.info(f"Randomizing WiFi adapter MAC address to {new_mac_address} via registry")
+        
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, self._adapter_registry_key, 0, winreg.KEY_SET_VALUE) as adapter_key:
+            winreg.SetValueEx(adapter_key, "NetworkAddress", 0, winreg.REG_SZ, new_mac_address)
+        
+        self._set_adapter_admin_state("disable")
+        self._set_adapter_admin_state("enable")
+    
+    @retry_on_failure(retries=2, delay=1, retry_on=(subprocess.CalledProcessError,))
+    def _set_adapter_admin_state(self, admin_state: str) -> None:
+        """Disable or enable the WiFi interface through netsh"""
+        subprocess.run(
+            ["netsh", "interface", "set", "interface", f"name={self.config.wifi_adapter_name}", f"admin={admin_state}"],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            timeout=Constants.SUBPROCESS_EXECUTION_TIMEOUT
+        )
+    
+    @staticmethod
+    def _generate_random_mac() -> str:
+        """Random unicast, locally administered MAC as 12 hex digits"""
+        # Second hex digit 2 keeps the address unicast + locally administered, which Wi-Fi drivers accept
+        first_octet = (random.getrandbits(4) << 4) | 0x02
+        return f"{first_octet:02X}" + "".join(f"{random.getrandbits(8):02X}" for _ in range(5))
+    
+    def _find_adapter_registry_key(self) -> Optional[str]:
+        """Find the driver registry key of the configured WiFi adapter (None without winreg/admin rights)"""
+        if winreg is None or not _is_admin():
+            return None
+        
         try:
-            self.logger.debug(f"Executing: {' '.join(command)}")
-            result = subprocess.run(
-                command, 
-                check=True, 
-                capture_output=True, 
-                text=True, 
-                timeout=30
-            )
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, Constants.NETWORK_ADAPTER_CLASS_KEY) as class_key:
+                subkey_index = 0
+                while True:
+                    try:
+                        subkey_name = winreg.EnumKey(class_key, subkey_index)
+                    except OSError:
+                        return None  # No more adapters
+                    subkey_index += 1
+                    
+                    adapter_key_path = f"{Constants.NETWORK_ADAPTER_CLASS_KEY}\\{subkey_name}"
+                    if self._adapter_connection_name(adapter_key_path) == self.config.wifi_adapter_name:
+                        return adapter_key_path
+        except OSError as e:
+            self.logger.debug(f"Network adapter registry lookup failed: {e}")
+            return None
+    
+    @staticmethod
+    def _adapter_connection_name(adapter_key_path: str) -> Optional[str]:
+        """Map an adapter's driver key to its connection name (e.g. "Wi-Fi") through NetCfgInstanceId"""
+        try:
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, adapter_key_path) as adapter_key:
+                instance_id, _ = winreg.QueryValueEx(adapter_key, "NetCfgInstanceId")
+            connection_key_path = f"{Constants.NETWORK_CONNECTION_KEY}\\{instance_id}\\Connection"
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, connection_key_path) as connection_key:
+                connection_name, _ = winreg.QueryValueEx(connection_key, "Name")
+            return connection_name
+        except OSError:
+            return None  # "Properties" and virtual adapters lack these values
+    
+    def _wait_for_adapter_ready(self) -> None:
+        """Return once the WiFi adapter is up with a routable IPv4 address, or after the stabilization time"""
+        stabilization_time = self.config.network_adapter_stabilization_time
+        if psutil is None:
+            time.sleep(stabilization_time)  # No way to observe the adapter - use the full wait
+            return
+        
+        deadline = time.monotonic() + stabilization_time
+        time.sleep(min(Constants.ADAPTER_READY_MIN_WAIT, stabilization_time))
+        
+        while time.monotonic() < deadline:
+            if self._is_adapter_ready():
+                self.logger.info("Network adapter is back online")
+                return
+            time.sleep(Constants.ADAPTER_READY_POLL_INTERVAL)
+        
+        self.logger.debug("Network adapter readiness not confirmed - continuing after full wait")
+    
+    def _is_adapter_ready(self) -> bool:
+        """Check that the WiFi adapter is up and holds a non link-local IPv4 address"""
+        adapter_name = self.config.wifi_adapter_name
+        try:
+            adapter_stats = psutil.net_if_stats().get(adapter_name)
+            if adapter_stats is None or not adapter_stats.isup:
+                return False
             
-            self.logger.info("MAC address randomized successfully")
-            self.logger.info(f"Waiting {self.config.network_adapter_stabilization_time}s for network adapter reset...")
+            return any(
+                address.family == socket.AF_INET and not address.address.startswith("169.254.")
+                for address in psutil.net_if_addrs().get(adapter_name, [])
+            )
+        except Exception:
+            return False
+
+class CaptivePortalClient:
+    """Logs in to the captive portal by replaying its form submissions over plain HTTP"""
+    
+    def __init__(self, logger: logging.Logger, config: WifiConfig,
+                 connectivity_check: Optional[Callable[[], bool]] = None):
+        import requests
+        
+        self.logger = logger
+        self.config = config
+        self.connectivity_check = connectivity_check
+        # Cookies set by earlier steps (portal session IDs) carry over to the later ones
+        self._session = requests.Session()
+    
+    def execute_captive_portal_login(self) -> LoginResult:
+        """Submit the configured portal requests in order and confirm that access was granted"""
+        import requests
+        
+        self.logger.info("Submitting captive portal login requests...")
+        # Each attempt starts a fresh portal session - cookies from an expired one would be replayed otherwise
+        self._session.cookies.clear()
+        try:
+            for login_url, form_data in self.config.portal_login_requests:
+                response = self._session.post(login_url, data=form_data, timeout=Constants.PORTAL_REQUEST_TIMEOUT)
+                response.raise_for_status()
+        except requests.Timeout:
+            self.logger.error("Direct captive portal login timed out")
+            return LoginResult.TIMEOUT
+        except requests.RequestException as e:
+            self.logger.error(f"Direct captive portal login failed: {e}")
+            return LoginResult.FAILED
+        
+        # Portals often answer 200 even when they reject a login - only open access counts
+        if self.connectivity_check and not self._await_internet_access():
+            self.logger.warning("Portal accepted the login requests but internet access did not open")
+            return LoginResult.FAILED
+        
+        self.logger.info("Direct captive portal login completed")
+        return LoginResult.SUCCESS
+    
+    def _await_internet_access(self) -> bool:
+        """Give the portal a few seconds to open the gateway after the last request"""
+        deadline = time.monotonic() + Constants.POST_LOGIN_VERIFICATION_WAIT
+        while True:
+            if self.connectivity_check():
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            # Negative connectivity results are cached this long - polling faster only re-reads the cache
+            time.sleep(Constants.CONNECTIVITY_NEGATIVE_CACHE_DURATION)
+    
+    def close(self) -> None:
+        """Close pooled HTTP connections"""
+        self._session.close()
+
+class BrowserDriverPool:
+    """Pool of pre-warmed Edge drivers checked out per captive portal attempt"""
+    
+    def __init__(self, logger: logging.Logger, driver_factory: Callable[[], webdriver.Edge], pool_size: int,
+                 on_driver_quit: Optional[Callable[[webdriver.Edge], None]] = None):
+        self.logger = logger
+        self.pool_size = max(1, min(pool_size, os.cpu_count() or 1))
+        self._driver_factory = driver_factory
+        self._on_driver_quit = on_driver_quit  # Lets the owner release per-driver resources
+        self._idle_drivers: "queue.Queue[webdriver.Edge]" = queue.Queue()
+        self._live_drivers: List[webdriver.Edge] = []
+        self._reserved_slots = 0
+        self._closed = False  # Set by close(); launches that finish afterwards are quit, not pooled
+        self._lock = threading.Lock()
+    
+    def prewarm(self) -> None:
+        """Launch drivers up to pool size in the background so the first login doesn't pay startup cost"""
+        threading.Thread(target=self._prewarm_drivers, name="browser-prewarm", daemon=True).start()
+    
+    @contextmanager
+    def acquire(self):
+        """Check out a clean driver for one login attempt and return it to the pool afterwards"""
+        driver = self._checkout()
+        
+        # Idle drivers were already reset when returned, so only confirm the session is still alive.
+        # After sleep/hibernate every idle browser may be dead - once pool_size have been discarded
+        # the next checkout is guaranteed to launch a fresh one.
+        for _ in range(self.pool_size):
+            try:
+                self._check_driver_alive(driver)
+                break
+            except Exception as e:
+                # Stale or crashed browser, or a dead msedgedriver (urllib3 connection errors,
+                # not WebDriverException) - tear down and take the next one
+                self.logger.warning(f"Browser session unhealthy, restarting: {e}")
+                self._discard(driver)
+                driver = self._checkout()
+        
+        try:
+            yield driver
+        finally:
+            try:
+                self._reset_browser_state(driver)
+                self._idle_drivers.put(driver)
+            except Exception:
+                self._discard(driver)  # Slot is freed for a fresh browser
+    
+    def close(self) -> None:
+        """Quit every driver owned by the pool"""
+        with self._lock:
+            self._closed = True
+            drivers = list(self._live_drivers)
+            self._live_drivers.clear()
+            self._reserved_slots = 0
+        
+        while not self._idle_drivers.empty():
+            try:
+                self._idle_drivers.get_nowait()
+            except queue.Empty:
+                break
+        
+        for driver in drivers:
+            self._quit_driver(driver)
+            if self._on_driver_quit:
+                self._on_driver_quit(driver)
+    
+    def _prewarm_drivers(self) -> None:
+        """Fill the idle queue until the pool is at capacity"""
+        while self._reserve_slot():
+            try:
+                self._idle_drivers.put(self._create_driver())
+            except Exception as e:
+                self._release_slot()  # A waiting checkout sees the freed slot and launches its own browser
+                if not self._closed:
+                    self.logger.warning(f"Browser pre-warm failed: {e}")
+                return
+    
+    def _checkout(self) -> webdriver.Edge:
+        """Take an idle driver, growing the pool if it is below capacity"""
+        while True:
+            if self._closed:
+                raise BrowserError("Browser pool is closed")
+            try:
+                return self._idle_drivers.get_nowait()
+            except queue.Empty:
+                pass
             
-            # Critical: Network stack needs time to reinitialize with new MAC
-            time.sleep(self.config.network_adapter_stabilization_time)
+            if self._reserve_slot():
+                try:
+                    return self._create_driver()
+                except Exception:
+                    self._release_slot()
+                    raise
             
+            # Pool is full - wait for a driver to be released, but re-check capacity periodically
+            # since a slot held by a pre-warm launch is freed without a driver if the launch fails
+            try:
+                return self._idle_drivers.get(timeout=Constants.BROWSER_POOL_WAIT_INTERVAL)
+            except queue.Empty:
+                continue
+    
+    def _create_driver(self) -> webdriver.Edge:
+        """Launch a driver for an already reserved slot"""
+        driver = self._driver_factory()
+        with self._lock:
+            closed = self._closed
+            if not closed:
+                self._live_drivers.append(driver)
+        if closed:
+            # close() already drained the pool (e.g. Ctrl+C during a pre-warm launch) - don't leak this one
+            self._quit_driver(driver)
+            if self._on_driver_quit:
+                self._on_driver_quit(driver)
+            raise BrowserError("Browser pool closed while the browser was starting")
+        return driver
+    
+    def _discard(self, driver: webdriver.Edge) -> None:
+        """Quit a broken driver and free its pool slot"""
+        with self._lock:
+            if driver in self._live_drivers:
+                self._live_drivers.remove(driver)
+                self._reserved_slots -= 1
+        self._quit_driver(driver)
+        if self._on_driver_quit:
+            self._on_driver_quit(driver)
+    
+    def _reserve_slot(self) -> bool:
+        """Atomically claim capacity for one more driver"""
+        with self._lock:
+            if self._closed or self._reserved_slots >= self.pool_size:
+                return False
+            self._reserved_slots += 1
             return True
-            
-        except subprocess.CalledProcessError as e:
-            raise MacAddressError(f"MAC randomization failed: {e.stderr}")
-        except Exception as e:
-            raise MacAddressError(f"Unexpected MAC randomization error: {e}")
+    
+    def _release_slot(self) -> None:
+        """Give back capacity claimed for a driver that failed to launch"""
+        with self._lock:
+            self._reserved_slots -= 1
+    
+    @staticmethod
+    def _check_driver_alive(driver: webdriver.Edge) -> None:
+        """Cheap single round trip that raises if the browser or its driver service has died"""
+        driver.current_url
+    
+    @staticmethod
+    def _reset_browser_state(driver: webdriver.Edge) -> None:
+        """Clear cookies and navigate away so the next login starts clean"""
+        driver.delete_all_cookies()
+        driver.get("about:blank")
+    
+    @staticmethod
+    def _quit_driver(driver: webdriver.Edge) -> None:
+        """Quit a driver, ignoring errors from already-dead sessions"""
+        try:
+            driver.quit()
+        except Exception:
+            pass  # Ignore errors during cleanup
 
 class BrowserManager:
     """Manages automated browser interactions for captive portal authentication"""
     
-    def __init__(self, logger: logging.Logger, config: WifiConfig):
+    def __init__(self, logger: logging.Logger, config: WifiConfig,
+                 connectivity_check: Optional[Callable[[], bool]] = None):
         self.logger = logger
         self.config = config
-        self.driver: Optional[webdriver.Edge] = None
-        self.spawned_browser_processes: List[int] = []
+        self.connectivity_check = connectivity_check
+        # Edge processes per driver: psutil.Process objects (which detect PID reuse before signalling)
+        # or, without psutil, (pid, creation time) pairs so a recycled PID is never killed
+        self._browser_processes: Dict[webdriver.Edge, List[Any]] = {}
+        self._driver_processes: List[subprocess.Popen] = []  # msedgedriver services, ended directly on cleanup
+        self._driver_tracking_failed = False
+        self._powershell = PowerShellSession(logger)  # Only started if psutil is unavailable
+        self._driver_pool = BrowserDriverPool(
+            logger, self._launch_tracked_browser, config.browser_pool_size, on_driver_quit=self._end_browser_processes
+        )
+        
+        # Browsers are kept alive across login attempts, so quit them on interpreter exit
+        atexit.register(self.close)
     
     @contextmanager
     def managed_browser_session(self):
-        """Context manager for browser sessions with automatic cleanup"""
-        initial_browser_pids = self._enumerate_browser_processes()
-        
-        try:
-            self.driver = self._initialize_headless_browser()
-            self._register_spawned_processes(initial_browser_pids)
-            yield self.driver
-        finally:
-            self._cleanup_browser_session()
+        """Context manager scoping one login attempt on a pooled browser"""
+        with self._driver_pool.acquire() as driver:
+            yield driver
+    
+    def prewarm(self) -> None:
+        """Start browsers ahead of the first captive portal login"""
+        self._driver_pool.prewarm()
+    
+    def close(self) -> None:
+        """Quit pooled browsers, terminate their spawned processes and stop the PowerShell fallback session"""
+        self._cleanup_browser_session()
+        self._powershell.close()
     
+    def _launch_tracked_browser(self) -> webdriver.Edge:
+        """Launch a browser and record the processes it spawned for cleanup"""
+        driver = self._initialize_headless_browser()
+        self._register_driver_descendants(driver)
+        self._register_driver_process(driver)
+        return driver
+    
+    @retry_on_failure(retries=2, retry_on=(WebDriverException,))
     def _initialize_headless_browser(self) -> webdriver.Edge:
         """Initialize optimized headless Edge browser for captive portal automation"""
+        from selenium import webdriver
+        from selenium.webdriver.edge.service import Service
+        
         service = Service(executable_path=self.config.edge_driver_path)
         options = webdriver.EdgeOptions()
         
@@ -398,13 +1115,27 @@ class BrowserManager:
         options.add_argument("--disable-background-timer-throttling")
         options.add_argument("--disable-backgrounding-occluded-windows")
         options.add_argument("--disable-renderer-backgrounding")
+        options.add_argument("--disable-features=Translate,MediaRouter,OptimizationHints")
+        
+        # Skip bytes we never read - images and fonts dominate portal load time on slow links
+        # (stylesheets stay enabled: clickability checks depend on the portal's layout)
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+        })
         
-        # Load strategy optimized for simple captive portals
-        options.page_load_strategy = 'eager'
+        # Don't wait for the page at all: get() returns at once and the in-page click waits
+        # act as soon as the buttons exist, however slowly the rest of the portal streams in
+        options.page_load_strategy = 'none'
         options.add_experimental_option('excludeSwitches', ['enable-logging'])
         options.add_experimental_option('useAutomationExtension', False)
         
-        return webdriver.Edge(service=service, options=options)
+        # Reuse one HTTP connection to msedgedriver for every command (early Selenium 4 releases default to off)
+        driver = webdriver.Edge(service=service, options=options, keep_alive=True)
+        # In-page waits end themselves at their own timeout; this only has to outlast the longest one
+        driver.set_script_timeout(Constants.SELENIUM_OPERATION_TIMEOUT + Constants.PORTAL_INTERACTION_DELAY + 5)
+        return driver
     
     def execute_captive_portal_login(self) -> LoginResult:
         """Execute the complete captive portal authentication flow"""
@@ -413,15 +1144,17 @@ class BrowserManager:
                 self.logger.info("Initiating captive portal authentication...")
                 
                 # Navigate to a non-HTTPS site to trigger captive portal redirect
+                start_url = driver.current_url  # data:, on a fresh browser, about:blank on a reused one
                 driver.get("http://neverssl.com")
-                
-                wait = WebDriverWait(driver, Constants.SELENIUM_OPERATION_TIMEOUT)
+                # With the 'none' load strategy get() returns before the portal arrives - the popup's
+                # short timeout should only start once its document exists
+                self._await_portal_document(driver, start_url)
                 
                 # Handle any dismissible popups first
                 self._dismiss_reminder_popup(driver)
                 
                 # Execute the portal navigation sequence
-                self._navigate_captive_portal_flow(driver, wait)
+                self._navigate_captive_portal_flow(driver)
                 
                 self.logger.info("Captive portal authentication sequence completed")
                 return LoginResult.SUCCESS
@@ -435,181 +1168,398 @@ class BrowserManager:
     
     def _dismiss_reminder_popup(self, driver: webdriver.Edge) -> None:
         """Dismiss any reminder or promotional popups that may appear"""
-        try:
-            popup_wait = WebDriverWait(driver, Constants.CAPTIVE_PORTAL_POPUP_TIMEOUT)
-            popup_button = popup_wait.until(
-                EC.element_to_be_clickable((By.XPATH, self.config.xpath_popup_remind_later))
-            )
-            self.logger.info("Dismissing captive portal popup...")
-            time.sleep(1)  # Brief pause for popup stability
-            driver.execute_script("arguments[0].click();", popup_button)
-            self.logger.info("Popup dismissed successfully")
-        except TimeoutException:
+        # No settle pause needed: the JS click doesn't depend on the popup's animation finishing
+        if self._click_when_ready(driver, ('id', self.config.id_popup_remind_later),
+                                  self.config.xpath_popup_remind_later, Constants.CAPTIVE_PORTAL_POPUP_TIMEOUT):
+            self.logger.info("Captive portal popup dismissed")
+        else:
             self.logger.debug("No popup detected - proceeding with main flow")
     
-    def _navigate_captive_portal_flow(self, driver: webdriver.Edge, wait: WebDriverWait) -> None:
+    def _navigate_captive_portal_flow(self, driver: webdriver.Edge) -> None:
         """Execute the two-step captive portal button sequence"""
         # Step 1: Click initial access button
         self.logger.info("Clicking initial access button...")
-        button1 = wait.until(EC.element_to_be_clickable((By.XPATH, self.config.xpath_button_1)))
-        driver.execute_script("arguments[0].click();", button1)
+        if not self._click_when_ready(driver, ('css', self.config.css_button_1), self.config.xpath_button_1,
+                                      Constants.SELENIUM_OPERATION_TIMEOUT):
+            raise TimeoutException("Initial access button never became clickable")
         self.logger.info("Initial button clicked")
         
-        # Critical delay: Many captive portals require time between interactions
-        time.sleep(Constants.PORTAL_INTERACTION_DELAY)
-        
         # Step 2: Click final connection button
+        # Critical delay: Many captive portals require time between interactions. Waiting for
+        # the button counts toward it, and the element is re-resolved until the moment of the click.
         self.logger.info("Clicking connection confirmation button...")
-        button2 = wait.until(EC.element_to_be_clickable((By.XPATH, self.config.xpath_button_2)))
-        driver.execute_script("arguments[0].click();", button2)
-        driver.execute_script("arguments[0].click();", button2)  # Double-click for reliability
+        pre_click_url = self._click_when_ready(
+            driver, ('id', self.config.id_button_2), self.config.xpath_button_2,
+            Constants.SELENIUM_OPERATION_TIMEOUT, not_before=Constants.PORTAL_INTERACTION_DELAY
+        )
+        if not pre_click_url:
+            raise TimeoutException("Connection button never became clickable")
         self.logger.info("Connection button clicked")
         
-        # Wait for connection establishment
-        time.sleep(Constants.POST_LOGIN_VERIFICATION_WAIT)
+        # Wait for connection establishment - return as soon as the portal reacts
+        self._await_post_login_state(driver, pre_click_url)
+    
+    @staticmethod
+    def _await_portal_document(driver: webdriver.Edge, start_url: str) -> None:
+        """Wait until a document other than start_url has been parsed (raises TimeoutException)"""
+        from selenium.webdriver.support.ui import WebDriverWait
+        
+        WebDriverWait(
+            driver, Constants.SELENIUM_OPERATION_TIMEOUT, poll_frequency=Constants.SELENIUM_POLL_FREQUENCY,
+            ignored_exceptions=(WebDriverException,)  # Script calls can fail while the navigation swaps documents
+        ).until(lambda d: d.execute_script(
+            "return location.href !== arguments[0] && document.readyState !== 'loading';", start_url
+        ))
     
-    def _enumerate_browser_processes(self) -> List[int]:
-        """Get current Edge browser process IDs for cleanup tracking"""
+    @staticmethod
+    def _click_when_ready(driver: webdriver.Edge, fast_locator: tuple, xpath: str,
+                          timeout: float, not_before: float = 0) -> Optional[str]:
+        """Click the element once clickable (and not before not_before seconds); pre-click URL or None on timeout"""
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            try:
+                return driver.execute_async_script(
+                    _CLICK_WHEN_READY_SCRIPT, fast_locator[0], fast_locator[1], xpath,
+                    int(remaining * 1000), int(not_before * 1000), int(Constants.SELENIUM_POLL_FREQUENCY * 1000)
+                )
+            except JavascriptException:
+                # The page navigated (e.g. the portal redirect) while the script waited - rerun on the new page
+                continue
+            except WebDriverException:
+                # Other navigation races ("cannot find context with specified id") - retry until the deadline
+                time.sleep(Constants.SELENIUM_POLL_FREQUENCY)
+    
+    def _await_post_login_state(self, driver: webdriver.Edge, pre_click_url: str) -> None:
+        """Wait until the portal navigates away or internet access is confirmed"""
+        from selenium.webdriver.support.ui import WebDriverWait
+        
+        def login_took_effect(d: webdriver.Edge) -> bool:
+            if d.current_url != pre_click_url:
+                return True
+            return bool(self.connectivity_check and self.connectivity_check())
+        
         try:
-            result = subprocess.run(
-                ["tasklist", "/fi", "imagename eq msedge.exe", "/fo", "csv"],
-                capture_output=True, text=True, timeout=10
-            )
-            
-            process_ids = []
-            for line in result.stdout.split('\n')[1:]:  # Skip CSV header
-                if line.strip():
-                    csv_parts = line.split(',')
-                    if len(csv_parts) >= 2:
-                        pid_string = csv_parts[1].strip('"')
-                        if pid_string.isdigit():
-                            process_ids.append(int(pid_string))
-            return process_ids
+            WebDriverWait(
+                driver, Constants.POST_LOGIN_VERIFICATION_WAIT,
+                ignored_exceptions=(WebDriverException,)  # current_url can fail while the click's navigation swaps documents
+            ).until(login_took_effect)
+        except TimeoutException:
+            self.logger.debug("No post-login change detected - deferring to connectivity check")
+    
+    def _register_driver_descendants(self, driver: webdriver.Edge) -> None:
+        """Track only the Edge processes launched by this driver's msedgedriver service"""
+        service_process = getattr(driver.service, 'process', None)
+        if service_process is None:
+            return
+        
+        if psutil is None:
+            self._browser_processes[driver] = self._query_descendant_processes(service_process.pid)
+            return
+        
+        try:
+            self._browser_processes[driver] = psutil.Process(service_process.pid).children(recursive=True)
+        except psutil.Error:
+            return
+    
+    def _query_descendant_processes(self, parent_pid: int) -> List[Tuple[int, int]]:
+        """Walk the process tree below a PID through CIM, returning (pid, creation time) pairs (no psutil)"""
+        # One process snapshot, then breadth-first over ParentProcessId - the user's own Edge is never matched
+        script = (
+            "$all = Get-CimInstance Win32_Process -Property ProcessId,ParentProcessId,CreationDate\n"
+            f"$parents = @({parent_pid}); $found = @()\n"
+            "while ($parents.Count) {\n"
+            "    $children = @($all | Where-Object { $parents -contains $_.ParentProcessId })\n"
+            "    $found += $children\n"
+            "    $parents = @($children | ForEach-Object { $_.ProcessId })\n"
+            "}\n"
+            "($found | ForEach-Object { \"$($_.ProcessId):$($_.CreationDate.ToFileTimeUtc())\" }) -join ','"
+        )
+        try:
+            output = self._powershell.execute(script, timeout=10)
         except Exception:
             return []
+        processes = []
+        for entry in output.strip().split(','):
+            process_id, _, created = entry.partition(':')
+            if process_id.isdigit() and created.isdigit():
+                processes.append((int(process_id), int(created)))
+        return processes
     
-    def _register_spawned_processes(self, initial_browser_pids: List[int]) -> None:
-        """Track new browser processes for cleanup after automation"""
-        current_pids = self._enumerate_browser_processes()
-        newly_spawned_pids = [pid for pid in current_pids if pid not in initial_browser_pids]
-        self.spawned_browser_processes.extend(newly_spawned_pids)
+    def _register_driver_process(self, driver: webdriver.Edge) -> None:
+        """Remember the msedgedriver service process so cleanup can end it without taskkill /im"""
+        service_process = getattr(driver.service, 'process', None)
+        if service_process is None:
+            self._driver_tracking_failed = True
+            return
+        self._driver_processes.append(service_process)
     
     def _cleanup_browser_session(self) -> None:
         """Clean up browser session and terminate spawned processes"""
-        # Close WebDriver gracefully
-        if self.driver:
+        # Close pooled WebDrivers gracefully
+        self._driver_pool.close()
+        self._terminate_driver_processes()
+        
+        # Drivers quit above have had their processes ended; this catches any never handed to the pool
+        for driver in list(self._browser_processes):
+            self._end_browser_processes(driver)
+    
+    def _end_browser_processes(self, driver: webdriver.Edge) -> None:
+        """Stop Edge processes that outlived driver.quit() and stop tracking them"""
+        processes = self._browser_processes.pop(driver, None)
+        if not processes:
+            return
+        if psutil is not None:
+            self._terminate_processes(processes)
+        else:
+            self._stop_unchanged_processes(processes)
+    
+    def _stop_unchanged_processes(self, processes: List[Tuple[int, int]]) -> None:
+        """Force-stop processes in one PowerShell call, skipping any PID since reused by another process"""
+        expected_creation = "; ".join(f"{process_id}={created}" for process_id, created in processes)
+        script = (
+            f"$expected = @{{{expected_creation}}}\n"
+            "Get-CimInstance Win32_Process -Property ProcessId,CreationDate |\n"
+            "    Where-Object { $expected[[int]$_.ProcessId] -eq $_.CreationDate.ToFileTimeUtc() } |\n"
+            "    ForEach-Object { Stop-Process -Id $_.ProcessId -Force -ErrorAction SilentlyContinue }"
+        )
+        try:
+            self._powershell.execute(script, timeout=10)
+        except Exception:
+            pass  # Ignore cleanup errors
+    
+    def _terminate_driver_processes(self) -> None:
+        """End msedgedriver services that outlived driver.quit(), via their own process handles"""
+        for driver_process in self._driver_processes:
+            if driver_process.poll() is not None:
+                continue
             try:
-                self.driver.quit()
-            except Exception:
-                pass  # Ignore errors during cleanup
-            finally:
-                self.driver = None
+                driver_process.terminate()
+                driver_process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                driver_process.kill()
+            except OSError:
+                pass  # Process may have already terminated
+        self._driver_processes.clear()
         
-        # Force terminate any remaining browser processes
-        for process_id in self.spawned_browser_processes:
+        # Without a tracked handle the only option left is the blanket image-name kill
+        if self._driver_tracking_failed:
+            self._driver_tracking_failed = False
+            if psutil is not None:
+                self._terminate_processes([
+                    process for process in psutil.process_iter(['name'])
+                    if (process.info['name'] or "").lower() == "msedgedriver.exe"
+                ])
+                return
             try:
-                subprocess.run(["taskkill", "/f", "/pid", str(process_id)], 
-                             capture_output=True, timeout=5)
+                subprocess.run(["taskkill", "/f", "/im", "msedgedriver.exe"],
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
             except Exception:
+                pass  # Ignore cleanup errors
+    
+    @staticmethod
+    def _terminate_processes(processes: List[psutil.Process]) -> None:
+        """Terminate processes in-process via psutil, waiting on all at once and killing any that linger"""
+        terminated = []
+        for process in processes:
+            try:
+                process.terminate()  # Raises NoSuchProcess if the PID now belongs to another process
+                terminated.append(process)
+            except psutil.Error:
                 pass  # Process may have already terminated
-        self.spawned_browser_processes.clear()
+        
+        # One shared 2s grace period instead of up to 2s per process
+        _, still_alive = psutil.wait_procs(terminated, timeout=2)
+        for process in still_alive:
+            try:
+                process.kill()
+            except psutil.Error:
+                pass
 
 class HotspotManager:
     """Manages Windows Mobile Hotspot for internet connection sharing"""
     
+    # Hotspot helpers written to a .ps1 file and dot-sourced once into the persistent
+    # PowerShell session, so each call only sends a function name instead of a script
+    HOTSPOT_HELPER_SCRIPT = """
+Add-Type -AssemblyName System.Runtime.WindowsRuntime
+
+# Helper to await Windows Runtime async operations
+$global:asTaskGeneric = ([System.WindowsRuntimeSystemExtensions].GetMethods() | ? { $_.Name -eq 'AsTask' -and $_.GetParameters().Count -eq 1 -and $_.GetParameters()[0].ParameterType.Name -eq 'IAsyncOperation`1' })[0]
+function global:Await($WinRtTask, $ResultType) {
+    $asTask = $global:asTaskGeneric.MakeGenericMethod($ResultType)
+    $netTask = $asTask.Invoke($null, @($WinRtTask))
+    $netTask.Wait(-1) | Out-Null
+    $netTask.Result
+}
+
+# Tethering manager is reused until the internet connection profile changes
+$global:cachedTetheringManager = $null
+$global:cachedTetheringProfileKey = $null
+
+function global:Get-TetheringManager {
+    $connectionProfile = [Windows.Networking.Connectivity.NetworkInformation, Windows.Networking.Connectivity, ContentType=WindowsRuntime]::GetInternetConnectionProfile()
+    if (-not $connectionProfile) {
+        $global:cachedTetheringManager = $null
+        $global:cachedTetheringProfileKey = $null
+        return
+    }
+    
+    $profileKey = "$($connectionProfile.ProfileName)|$($connectionProfile.NetworkAdapter.NetworkAdapterId)"
+    if ($global:cachedTetheringProfileKey -ne $profileKey -or -not $global:cachedTetheringManager) {
+        $global:cachedTetheringManager = [Windows.Networking.NetworkOperators.NetworkOperatorTetheringManager, Windows.Networking.NetworkOperators, ContentType=WindowsRuntime]::CreateFromConnectionProfile($connectionProfile)
+        $global:cachedTetheringProfileKey = $profileKey
+    }
+    $global:cachedTetheringManager
+}
+
+# Availability and current state in one round trip (used once at startup)
+function global:Get-WifiHotspotProbe {
+    try {
+        $manager = Get-TetheringManager
+        if (-not $manager) { Write-Output "UNAVAILABLE"; return }
+        Write-Output "AVAILABLE"
+        Write-Output $manager.TetheringOperationalState
+    } catch { Write-Output "UNAVAILABLE" }
+}
+
+function global:Get-WifiHotspotState {
+    try {
+        $manager = Get-TetheringManager
+        if ($manager) { Write-Output $manager.TetheringOperationalState } else { Write-Output "0" }
+    } catch { Write-Output "0" }
+}
+
+# Single round trip: check current state and only start/stop tethering if it differs
+function global:Set-WifiHotspotState([bool]$Enable) {
+    try {
+        $manager = Get-TetheringManager
+        if (-not $manager) {
+            # Without a connection profile nothing can be shared - the hotspot is already off
+            if ($Enable) { Write-Output "ERROR: No internet connection profile available" }
+            else { Write-Output "STATE:OFF,CHANGED:false" }
+            return
+        }
+        
+        $targetState = if ($Enable) { "ON" } else { "OFF" }
+        $isOn = "$($manager.TetheringOperationalState)" -eq "On"
+        if ($isOn -eq $Enable) { Write-Output "STATE:$targetState,CHANGED:false"; return }
+        
+        $resultType = [Windows.Networking.NetworkOperators.NetworkOperatorTetheringOperationResult]
+        if ($Enable) { $result = Await ($manager.StartTetheringAsync()) ($resultType) }
+        else { $result = Await ($manager.StopTetheringAsync()) ($resultType) }
+        
+        if ("$($result.Status)" -ne "Success") { Write-Output "ERROR: $($result.Status) $($result.AdditionalErrorMessage)"; return }
+        Write-Output "STATE:$targetState,CHANGED:true"
+    } catch { Write-Output "ERROR: $($_.Exception.Message)" }
+}
+"""
+    
     def __init__(self, logger: logging.Logger, config: WifiConfig):
         self.logger = logger
         self.config = config
-        self._hotspot_status_cache_time: Optional[datetime] = None
+        self._hotspot_status_cache_time: Optional[float] = None
         self._cached_hotspot_status: Optional[bool] = None
-        self._administrator_privileges: Optional[bool] = None
+        self._hotspot_is_on: Optional[bool] = None  # Last state confirmed by our own queries/toggles
+        self._hotspot_functionality_available: Optional[bool] = None
+        self._tethering_manager = None  # Reused while the internet connection profile stays the same
+        self._tethering_profile_key: Optional[tuple] = None
+        # Helpers are defined inline when the session starts - unlike a .ps1 file, inline
+        # script text is not subject to the execution policy (Restricted on Windows clients)
+        self._powershell = PowerShellSession(logger, init_script=self.HOTSPOT_HELPER_SCRIPT)
+        # Single worker keeps toggles and background status refreshes ordered and off the monitoring loop
+        self._worker_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hotspot-worker")
+        self._pending_status_refresh: Optional[Future] = None
     
     def has_administrator_privileges(self) -> bool:
         """Check if running with administrator privileges (required for hotspot control)"""
-        if self._administrator_privileges is None:
-            try:
-                self._administrator_privileges = bool(ctypes.windll.shell32.IsUserAnAdmin())
-            except:
-                self._administrator_privileges = False
-        return self._administrator_privileges
+        return _is_admin()
     
     def is_hotspot_functionality_available(self) -> bool:
         """Check if Windows mobile hotspot functionality is available on this system"""
         if not self.has_administrator_privileges():
             return False
         
+        # Hotspot hardware and WinRT support don't change while running - probe only once
+        if self._hotspot_functionality_available is None:
+            self._hotspot_functionality_available = self._probe_hotspot_functionality()
+        return self._hotspot_functionality_available
+    
+    def _probe_hotspot_functionality(self) -> bool:
+        """Test whether the WinRT tethering API can be used, recording the current state from the same call"""
+        if NetworkOperatorTetheringManager is not None:
+            try:
+                tethering_manager = self._get_tethering_manager()
+                if tethering_manager is None:
+                    return False
+                self._record_hotspot_state(
+                    tethering_manager.tethering_operational_state == TetheringOperationalState.ON
+                )
+                return True
+            except Exception:
+                return False
+        
         try:
-            # Test Windows Runtime hotspot API availability
-            powershell_test_command = """
-            try {
-                $profile = [Windows.Networking.Connectivity.NetworkInformation, Windows.Networking.Connectivity, ContentType=WindowsRuntime]::GetInternetConnectionProfile()
-                if ($profile) { 
-                    [Windows.Networking.NetworkOperators.NetworkOperatorTetheringManager, Windows.Networking.NetworkOperators, ContentType=WindowsRuntime]::CreateFromConnectionProfile($profile)
-                    Write-Output "AVAILABLE"
-                } else { exit 1 }
-            } catch { exit 1 }
-            """
-            result = subprocess.run(["powershell", "-Command", powershell_test_command], 
-                                  capture_output=True, text=True, timeout=10)
-            return result.returncode == 0 and "AVAILABLE" in result.stdout
+            output_lines = self._run_hotspot_helper("Get-WifiHotspotProbe", timeout=10).strip().splitlines()
         except Exception:
             return False
+        
+        if not output_lines or output_lines[0].strip() != "AVAILABLE":
+            return False
+        
+        # Second line carries the operational state - seed the status cache with it
+        if len(output_lines) > 1:
+            try:
+                self._record_hotspot_state(self._parse_operational_state(output_lines[1].strip()))
+            except ValueError:
+                self.logger.debug(f"Invalid Windows API response: '{output_lines[1]}'")
+        return True
     
     def get_hotspot_status(self) -> bool:
-        """Get mobile hotspot status with caching to reduce Windows API calls"""
-        # Return cached status if still valid
-        if (self._hotspot_status_cache_time and 
-            datetime.now() - self._hotspot_status_cache_time < timedelta(seconds=Constants.HOTSPOT_STATUS_CACHE_DURATION)):
-            return self._cached_hotspot_status or False
+        """Get mobile hotspot status, serving a stale cached value while it is refreshed in the background"""
+        # Nothing cached yet - the first query has to block
+        if self._hotspot_status_cache_time is None:
+            return self._query_windows_hotspot_api()
         
-        return self._query_windows_hotspot_api()
+        if time.monotonic() - self._hotspot_status_cache_time >= Constants.HOTSPOT_STATUS_CACHE_DURATION:
+            self._refresh_hotspot_status_in_background()
+        return self._cached_hotspot_status or False
     
-    def get_hotspot_status_no_cache(self) -> bool:
-        """Get mobile hotspot status without using cache (for critical checks)"""
-        return self._query_windows_hotspot_api()
+    def get_known_hotspot_status(self) -> Optional[bool]:
+        """Return the last confirmed hotspot state without calling Windows (None if never confirmed)"""
+        return self._hotspot_is_on
     
     def _query_windows_hotspot_api(self) -> bool:
         """Query Windows Runtime API for current hotspot operational state"""
+        if NetworkOperatorTetheringManager is not None:
+            try:
+                tethering_manager = self._get_tethering_manager()
+                hotspot_active = (
+                    tethering_manager is not None and
+                    tethering_manager.tethering_operational_state == TetheringOperationalState.ON
+                )
+                self._record_hotspot_state(hotspot_active)
+                self.logger.debug(f"Mobile hotspot status: {hotspot_active}")
+                return hotspot_active
+            except Exception as e:
+                self.logger.debug(f"Hotspot status query failed: {e}")
+                self._update_hotspot_cache(False)
+                return False
+        
         try:
-            # Use Windows Runtime API to get tethering state
-            powershell_status_command = '''
-try {
-    $profile = [Windows.Networking.Connectivity.NetworkInformation,Windows.Networking.Connectivity,ContentType=WindowsRuntime]::GetInternetConnectionProfile()
-    if ($profile) {
-        $manager = [Windows.Networking.NetworkOperators.NetworkOperatorTetheringManager,Windows.Networking.NetworkOperators,ContentType=WindowsRuntime]::CreateFromConnectionProfile($profile)
-        Write-Output $manager.TetheringOperationalState
-    } else {
-        Write-Output "0"
-    }
-} catch {
-    Write-Output "0"
-}
-            '''
+            api_output = self._run_hotspot_helper("Get-WifiHotspotState", timeout=10).strip()
             
-            result = subprocess.run(["powershell", "-Command", powershell_status_command], 
-                                  capture_output=True, text=True, timeout=10)
-            
-            if result.returncode == 0:
-                try:
-                    api_output = result.stdout.strip()
-                    self.logger.debug(f"Windows hotspot API output: '{api_output}'")
-                    
-                    # Handle both string and numeric responses from Windows API
-                    if api_output.lower() == "on":
-                        hotspot_active = True
-                    elif api_output.lower() == "off":
-                        hotspot_active = False
-                    else:
-                        # TetheringOperationalState enum: 0=Unknown, 1=Off, 2=On, 3=InTransition
-                        operational_state = int(api_output)
-                        hotspot_active = operational_state == 2
-                    
-                    self._update_hotspot_cache(hotspot_active)
-                    self.logger.debug(f"Mobile hotspot status: {hotspot_active}")
-                    return hotspot_active
-                except ValueError:
-                    self.logger.debug(f"Invalid Windows API response: '{result.stdout.strip()}'")
-                    
+            try:
+                self.logger.debug(f"Windows hotspot API output: '{api_output}'")
+                hotspot_active = self._parse_operational_state(api_output)
+                self._record_hotspot_state(hotspot_active)
+                self.logger.debug(f"Mobile hotspot status: {hotspot_active}")
+                return hotspot_active
+            except ValueError:
+                self.logger.debug(f"Invalid Windows API response: '{api_output}'")
+                
         except subprocess.TimeoutExpired:
             self.logger.debug("Hotspot status query timed out")
         except Exception as e:
@@ -618,117 +1568,147 @@ try {
         self._update_hotspot_cache(False)
         return False
     
+    @staticmethod
+    def _parse_operational_state(api_output: str) -> bool:
+        """Interpret a TetheringOperationalState value as on/off (raises ValueError if unrecognised)"""
+        # Handle both string and numeric responses from Windows API
+        if api_output.lower() == "on":
+            return True
+        if api_output.lower() == "off":
+            return False
+        # TetheringOperationalState enum: 0=Unknown, 1=Off, 2=On, 3=InTransition
+        return int(api_output) == 2
+    
     def enable_mobile_hotspot(self) -> bool:
-        """Enable Windows mobile hotspot for internet connection sharing"""
+        """Enable Windows mobile hotspot for internet connection sharing (returns True if it was switched on)"""
+        return self._set_hotspot_state(enable=True)
+    
+    def disable_mobile_hotspot(self) -> bool:
+        """Disable Windows mobile hotspot (returns True if it was switched off)"""
+        return self._set_hotspot_state(enable=False)
+    
+    def enable_mobile_hotspot_async(self) -> Future:
+        """Enable the hotspot on the background worker; the future resolves like enable_mobile_hotspot"""
+        return self._worker_executor.submit(self.enable_mobile_hotspot)
+    
+    def disable_mobile_hotspot_async(self) -> Future:
+        """Disable the hotspot on the background worker; the future resolves like disable_mobile_hotspot"""
+        return self._worker_executor.submit(self.disable_mobile_hotspot)
+    
+    def _refresh_hotspot_status_in_background(self) -> None:
+        """Queue a status query on the worker unless one is already pending"""
+        if self._pending_status_refresh is not None and not self._pending_status_refresh.done():
+            return
+        try:
+            self._pending_status_refresh = self._worker_executor.submit(self._query_windows_hotspot_api)
+        except RuntimeError:
+            pass  # Executor already shut down
+    
+    def close(self) -> None:
+        """Drop queued hotspot toggles and stop the PowerShell session"""
+        # Don't wait for a toggle that is already running
+        self._worker_executor.shutdown(wait=False, cancel_futures=True)
+        self._powershell.close()
+    
+    def _set_hotspot_state(self, enable: bool) -> bool:
+        """Bring the hotspot to the target state with one combined check-and-toggle call"""
         if not self.has_administrator_privileges():
             raise HotspotError("Administrator privileges required for hotspot control")
         
-        # Skip if hotspot is already active
-        if self.get_hotspot_status():
-            self.logger.info("Mobile hotspot already active")
-            return True
+        operation_name = "enable" if enable else "disable"
         
-        self.logger.info("Enabling mobile hotspot for connection sharing...")
+        if NetworkOperatorTetheringManager is not None:
+            state_changed = self._set_tethering_state_winrt(enable)
+        else:
+            try:
+                output = self._run_hotspot_helper(
+                    f"Set-WifiHotspotState -Enable ${str(enable).lower()}",
+                    timeout=Constants.SUBPROCESS_EXECUTION_TIMEOUT
+                )
+            except subprocess.TimeoutExpired:
+                raise HotspotError(f"Hotspot {operation_name} operation timed out")
+            except (subprocess.SubprocessError, OSError) as e:
+                raise HotspotError(f"PowerShell session error: {e}")
+            state_changed = self._parse_hotspot_state_response(output, operation_name)
         
-        try:
-            # Complex PowerShell command to enable hotspot via Windows Runtime API
-            enable_hotspot_command = """
-            try {
-                # Load Windows Runtime assembly for async operations
-                Add-Type -AssemblyName System.Runtime.WindowsRuntime
-                
-                # Helper function to await Windows Runtime async operations
-                $asTaskGeneric = ([System.WindowsRuntimeSystemExtensions].GetMethods() | ? { $_.Name -eq 'AsTask' -and $_.GetParameters().Count -eq 1 -and $_.GetParameters()[0].ParameterType.Name -eq 'IAsyncOperation`1' })[0]
-                Function Await($WinRtTask, $ResultType) {
-                    $asTask = $asTaskGeneric.MakeGenericMethod($ResultType)
-                    $netTask = $asTask.Invoke($null, @($WinRtTask))
-                    $netTask.Wait(-1) | Out-Null
-                    $netTask.Result
-                }
-                
-                # Get network profile and start tethering
-                $profile = [Windows.Networking.Connectivity.NetworkInformation, Windows.Networking.Connectivity, ContentType=WindowsRuntime]::GetInternetConnectionProfile()
-                if ($profile) {
-                    $manager = [Windows.Networking.NetworkOperators.NetworkOperatorTetheringManager, Windows.Networking.NetworkOperators, ContentType=WindowsRuntime]::CreateFromConnectionProfile($profile)
-                    $result = Await ($manager.StartTetheringAsync()) ([Windows.Networking.NetworkOperators.NetworkOperatorTetheringOperationResult])
-                    Write-Output "SUCCESS"
-                } else { Write-Output "ERROR: No internet connection profile available" }
-            } catch { Write-Output "ERROR: $($_.Exception.Message)" }
-            """
-            
-            result = subprocess.run(["powershell", "-Command", enable_hotspot_command], 
-                                  capture_output=True, text=True, timeout=Constants.SUBPROCESS_EXECUTION_TIMEOUT)
-            
-            if result.returncode == 0 and "SUCCESS" in result.stdout:
-                self._invalidate_hotspot_cache()
-                time.sleep(Constants.HOTSPOT_STATE_TRANSITION_TIME)
-                return True
-            else:
-                raise HotspotError(f"Hotspot enable operation failed: {result.stdout}")
-                
-        except subprocess.TimeoutExpired:
-            raise HotspotError("Hotspot enable operation timed out")
+        # The response is authoritative - no follow-up status query needed
+        self._record_hotspot_state(enable)
+        
+        if state_changed and enable:
+            time.sleep(Constants.HOTSPOT_STATE_TRANSITION_TIME)
+        return state_changed
     
-    def disable_mobile_hotspot(self) -> bool:
-        """Disable Windows mobile hotspot"""
-        if not self.has_administrator_privileges():
-            raise HotspotError("Administrator privileges required for hotspot control")
+    @staticmethod
+    def _parse_hotspot_state_response(output: str, operation_name: str) -> bool:
+        """Parse a 'STATE:ON,CHANGED:true' response line into whether the state changed"""
+        for line in output.splitlines():
+            if line.startswith("STATE:"):
+                return "CHANGED:true" in line
+        raise HotspotError(f"Hotspot {operation_name} operation failed: {output}")
+    
+    def _run_hotspot_helper(self, function_name: str, timeout: float) -> str:
+        """Call a helper function in the PowerShell session (helpers are defined when it starts)"""
+        return self._powershell.execute(function_name, timeout=timeout)
+    
+    def _get_tethering_manager(self):
+        """Get the WinRT tethering manager for the current internet connection profile, reusing it if unchanged"""
+        connection_profile = NetworkInformation.get_internet_connection_profile()
+        if connection_profile is None:
+            self._tethering_manager = None
+            self._tethering_profile_key = None
+            return None
         
-        # Skip if hotspot is already inactive
-        if not self.get_hotspot_status():
-            self.logger.info("Mobile hotspot already inactive")
-            return True
+        # Same key as the PowerShell helper's cache: profile name plus adapter ID
+        network_adapter = connection_profile.network_adapter
+        profile_key = (
+            connection_profile.profile_name,
+            str(network_adapter.network_adapter_id) if network_adapter is not None else ""
+        )
+        if self._tethering_manager is None or profile_key != self._tethering_profile_key:
+            self._tethering_manager = NetworkOperatorTetheringManager.create_from_connection_profile(connection_profile)
+            self._tethering_profile_key = profile_key
+        return self._tethering_manager
+    
+    def _set_tethering_state_winrt(self, enable: bool) -> bool:
+        """Start or stop tethering directly through WinRT if not already in the target state"""
+        import asyncio  # Only this winsdk toggle path needs an event loop - keep it off the startup path
+        
+        operation_name = "enable" if enable else "disable"
         
-        self.logger.info("Disabling mobile hotspot...")
+        async def await_operation(operation):
+            return await operation
         
         try:
-            # PowerShell command to disable hotspot via Windows Runtime API
-            disable_hotspot_command = """
-            try {
-                # Load Windows Runtime assembly for async operations
-                Add-Type -AssemblyName System.Runtime.WindowsRuntime
-                
-                # Helper function to await Windows Runtime async operations
-                $asTaskGeneric = ([System.WindowsRuntimeSystemExtensions].GetMethods() | ? { $_.Name -eq 'AsTask' -and $_.GetParameters().Count -eq 1 -and $_.GetParameters()[0].ParameterType.Name -eq 'IAsyncOperation`1' })[0]
-                Function Await($WinRtTask, $ResultType) {
-                    $asTask = $asTaskGeneric.MakeGenericMethod($ResultType)
-                    $netTask = $asTask.Invoke($null, @($WinRtTask))
-                    $netTask.Wait(-1) | Out-Null
-                    $netTask.Result
-                }
-                
-                # Get network profile and stop tethering
-                $profile = [Windows.Networking.Connectivity.NetworkInformation, Windows.Networking.Connectivity, ContentType=WindowsRuntime]::GetInternetConnectionProfile()
-                if ($profile) {
-                    $manager = [Windows.Networking.NetworkOperators.NetworkOperatorTetheringManager, Windows.Networking.NetworkOperators, ContentType=WindowsRuntime]::CreateFromConnectionProfile($profile)
-                    $result = Await ($manager.StopTetheringAsync()) ([Windows.Networking.NetworkOperators.NetworkOperatorTetheringOperationResult])
-                    Write-Output "SUCCESS"
-                } else { Write-Output "ERROR: No internet connection profile available" }
-            } catch { Write-Output "ERROR: $($_.Exception.Message)" }
-            """
+            tethering_manager = self._get_tethering_manager()
+            if tethering_manager is None:
+                if not enable:
+                    return False  # Without a connection profile nothing can be shared - already off
+                raise HotspotError(f"Hotspot {operation_name} operation failed: No internet connection profile available")
             
-            result = subprocess.run(["powershell", "-Command", disable_hotspot_command], 
-                                  capture_output=True, text=True, timeout=Constants.SUBPROCESS_EXECUTION_TIMEOUT)
+            is_on = tethering_manager.tethering_operational_state == TetheringOperationalState.ON
+            if is_on == enable:
+                return False
             
-            if result.returncode == 0 and "SUCCESS" in result.stdout:
-                self._invalidate_hotspot_cache()
-                self.logger.info("Mobile hotspot disabled")
-                return True
-            else:
-                raise HotspotError(f"Hotspot disable operation failed: {result.stdout}")
-                
-        except subprocess.TimeoutExpired:
-            raise HotspotError("Hotspot disable operation timed out")
+            operation = tethering_manager.start_tethering_async() if enable else tethering_manager.stop_tethering_async()
+            result = asyncio.run(await_operation(operation))
+        except HotspotError:
+            raise
+        except Exception as e:
+            raise HotspotError(f"Hotspot {operation_name} operation failed: {e}")
+        
+        if result.status != TetheringOperationStatus.SUCCESS:
+            raise HotspotError(f"Hotspot {operation_name} operation failed: {result.additional_error_message or result.status}")
+        return True
     
     def _update_hotspot_cache(self, hotspot_status: bool) -> None:
         """Update hotspot status cache with current timestamp"""
-        self._hotspot_status_cache_time = datetime.now()
+        self._hotspot_status_cache_time = time.monotonic()
         self._cached_hotspot_status = hotspot_status
     
-    def _invalidate_hotspot_cache(self) -> None:
-        """Force fresh hotspot status check on next query"""
-        self._hotspot_status_cache_time = None
-        self._cached_hotspot_status = None
+    def _record_hotspot_state(self, hotspot_status: bool) -> None:
+        """Store a state confirmed by Windows as both the cached and the known status"""
+        self._update_hotspot_cache(hotspot_status)
+        self._hotspot_is_on = hotspot_status
 
 # ================================= MAIN ORCHESTRATOR =================================
 
@@ -740,14 +1720,32 @@ class WifiAutoConnector:
         self.logger = setup_logging()
         self.connection_state = ConnectionState.DISCONNECTED
         self.failed_connection_attempts = 0
-        self.last_mac_reset_timestamp: Optional[datetime] = None
+        self._last_mac_reset_monotonic: Optional[float] = None
+        self._current_check_interval = config.connectivity_check_interval
+        self._hotspot_state_synced_monotonic: Optional[float] = None
+        self._pending_hotspot_toggle: Optional[Future] = None
+        self._pending_hotspot_enable = False
+        self._cleanup_done = threading.Event()
+        self._stop_event = threading.Event()  # Wakes the monitoring loop immediately on shutdown
+        # Repaint in place only on a console that renders ANSI escapes
+        self._status_screen_enabled = sys.stdout.isatty() and _enable_virtual_terminal_processing()
+        self._last_status_snapshot: Optional[tuple] = None
         
         # Initialize specialized managers
         self.network_manager = NetworkManager(self.logger, config)
         self.mac_manager = MacAddressManager(self.logger, config)
-        self.browser_manager = BrowserManager(self.logger, config)
+        self.portal_client = CaptivePortalClient(
+            self.logger, config, connectivity_check=self.network_manager.verify_internet_connectivity
+        )
+        self.browser_manager = BrowserManager(
+            self.logger, config, connectivity_check=self.network_manager.verify_internet_connectivity
+        )
         self.hotspot_manager = HotspotManager(self.logger, config)
         
+        # Config is frozen - the effective feature state is tracked here, resolved once
+        self._mac_spoofing_active = config.mac_spoofing_enabled and self.mac_manager.is_mac_spoofing_available()
+        self._browser_login_enabled = not config.portal_login_requests or config.use_browser_fallback
+        
         # Setup graceful shutdown handling
         self._setup_shutdown_handlers()
     
@@ -755,6 +1753,8 @@ class WifiAutoConnector:
         """Setup signal handlers for graceful application shutdown"""
         def shutdown_handler(signum, frame):
             self.logger.info("Received shutdown signal - performing cleanup...")
+            self._stop_event.set()
+            atexit.unregister(self._perform_cleanup)
             self._perform_cleanup()
             sys.exit(0)
         
@@ -765,13 +1765,18 @@ class WifiAutoConnector:
         atexit.register(self._perform_cleanup)
     
     def _perform_cleanup(self) -> None:
-        """Perform cleanup operations before shutdown"""
+        """Perform cleanup operations before shutdown (runs once across signal, finally and atexit)"""
+        if self._cleanup_done.is_set():
+            return
+        self._cleanup_done.set()
+        
         self.logger.info("Performing application cleanup...")
         try:
-            self.browser_manager._cleanup_browser_session()
-            # Terminate any orphaned WebDriver processes
-            subprocess.run(["taskkill", "/f", "/im", "msedgedriver.exe"], 
-                         capture_output=True, timeout=5)
+            self.hotspot_manager.close()
+            self.network_manager.close()
+            self.portal_client.close()
+            # Quits pooled browsers and ends their msedgedriver services by tracked handle
+            self.browser_manager.close()
         except Exception:
             pass  # Ignore cleanup errors
     
@@ -779,12 +1784,20 @@ class WifiAutoConnector:
         """Main execution loop for continuous WiFi connection monitoring"""
         self.logger.info("Starting WiFi Auto-Connector with captive portal support...")
         
+        # Edge starts on a background thread, so launch it first and let it overlap
+        # the PowerShell/WinRT hotspot probe instead of waiting for it. With a direct
+        # HTTP login configured the browser is only a fallback and starts on demand.
+        if not self.config.portal_login_requests:
+            self.browser_manager.prewarm()
+        
         # Verify system capabilities before starting
         self._verify_system_capabilities()
         
         try:
             # Continuous monitoring loop
-            while True:
+            while not self._stop_event.is_set():
+                # Collect a toggle that finished during the last wait so the display doesn't show it as pending
+                self._collect_hotspot_toggle_result()
                 self._display_current_status()
                 
                 if self.network_manager.verify_internet_connectivity():
@@ -804,11 +1817,9 @@ class WifiAutoConnector:
     def _verify_system_capabilities(self) -> None:
         """Verify and report on available system capabilities"""
         # Check MAC spoofing availability
-        if self.config.mac_spoofing_enabled:
-            if not self.mac_manager.is_mac_spoofing_available():
-                self.logger.warning("MAC spoofing tool not found - feature disabled")
-                self.logger.info("  Install with: pip install spoof-mac")
-                self.config.mac_spoofing_enabled = False
+        if self.config.mac_spoofing_enabled and not self._mac_spoofing_active:
+            self.logger.warning("MAC spoofing tool not found - feature disabled")
+            self.logger.info("  Run as administrator or install with: pip install spoof-mac")
         
         # Check mobile hotspot capability
         if self.config.mobile_hotspot_enabled:
@@ -818,31 +1829,72 @@ class WifiAutoConnector:
                 self.logger.warning("Mobile hotspot not available on this system")
             else:
                 self.logger.info("Mobile hotspot functionality ready")
+                # The availability probe already read the current state in the same call
+                self._hotspot_state_synced_monotonic = time.monotonic()
     
     def _display_current_status(self) -> None:
-        """Display current system status and configuration"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        """Display current system status and configuration (only when something changed)"""
+        hotspot_status = None
+        if self.config.mobile_hotspot_enabled:
+            known_hotspot_state = self.hotspot_manager.get_known_hotspot_status()
+            if self._pending_hotspot_toggle is not None:
+                hotspot_status = "Switching..."
+            elif known_hotspot_state is None:
+                hotspot_status = "Unknown"
+            else:
+                hotspot_status = "Active" if known_hotspot_state else "Inactive"
         
-        current_time = datetime.now().strftime('%H:%M:%S')
-        print(f"--- WiFi Auto-Connector Status ({current_time}) ---")
-        print(f"Connection State: {self.connection_state.value}")
-        print(f"Failed Attempts: {self.failed_connection_attempts}")
-        print(f"MAC Spoofing: {'Available' if self.mac_manager.is_mac_spoofing_available() else 'Unavailable'}")
-        print(f"Admin Privileges: {'Yes' if self.hotspot_manager.has_administrator_privileges() else 'No'}")
+        status_snapshot = (
+            self.connection_state,
+            self.failed_connection_attempts,
+            self.mac_manager.is_mac_spoofing_available(),
+            self.hotspot_manager.has_administrator_privileges(),
+            hotspot_status,
+        )
+        if status_snapshot == self._last_status_snapshot:
+            return
+        self._last_status_snapshot = status_snapshot
         
-        if self.config.mobile_hotspot_enabled:
-            hotspot_status = "Active" if self.hotspot_manager.get_hotspot_status_no_cache() else "Inactive"
-            print(f"Mobile Hotspot: {hotspot_status}")
+        connection_state, failed_attempts, mac_spoofing_available, is_admin, hotspot_status = status_snapshot
+        
+        # Redirected output (or a console without ANSI support) gets a single log line instead of a repaint
+        if not self._status_screen_enabled:
+            hotspot_summary = f", hotspot={hotspot_status}" if hotspot_status is not None else ""
+            self.logger.debug(
+                f"Status: state={connection_state.value}, failed_attempts={failed_attempts}, "
+                f"mac_spoofing={mac_spoofing_available}, admin={is_admin}{hotspot_summary}"
+            )
+            return
         
-        print("-" * 50)
+        current_time = datetime.now().strftime('%H:%M:%S')
+        status_lines = [
+            f"--- WiFi Auto-Connector Status ({current_time}) ---",
+            f"Connection State: {connection_state.value}",
+            f"Failed Attempts: {failed_attempts}",
+            f"MAC Spoofing: {'Available' if mac_spoofing_available else 'Unavailable'}",
+            f"Admin Privileges: {'Yes' if is_admin else 'No'}",
+        ]
+        if hotspot_status is not None:
+            status_lines.append(f"Mobile Hotspot: {hotspot_status}")
+        status_lines.append("-" * 50)
+        
+        # Clear screen + cursor home via ANSI instead of spawning cls/clear, then one write
+        sys.stdout.write("\x1b[2J\x1b[H" + "\n".join(status_lines) + "\n")
+        sys.stdout.flush()
     
     def _process_successful_connection(self) -> None:
         """Handle successful internet connection and manage hotspot sharing"""
+        self._collect_hotspot_toggle_result()
+        
         if self.connection_state != ConnectionState.CONNECTED:
             self.logger.info("Internet connection established!")
             self.connection_state = ConnectionState.CONNECTED
             self.failed_connection_attempts = 0
-            self.network_manager.invalidate_connectivity_cache()
+        
+        # Steady state - back off so an idle connected machine isn't probed every few seconds
+        self._current_check_interval = min(
+            self._current_check_interval * 2, self.config.max_connectivity_check_interval
+        )
         
         # Manage mobile hotspot for connection sharing
         if self.config.mobile_hotspot_enabled:
@@ -851,20 +1903,26 @@ class WifiAutoConnector:
                 self.config.persistent_hotspot_mode
             )
             
-            if should_activate_hotspot and not self.hotspot_manager.get_hotspot_status():
+            # Windows may switch an idle hotspot off by itself - re-read the real state now and then
+            if self.config.persistent_hotspot_mode:
+                self._resync_hotspot_state_if_due()
+            
+            if should_activate_hotspot and self.hotspot_manager.get_known_hotspot_status() is not True:
                 self._toggle_mobile_hotspot(enable=True)
     
     def _process_connection_failure(self) -> None:
         """Handle connection failure with escalating recovery strategies"""
+        self._collect_hotspot_toggle_result()
+        
         self.connection_state = ConnectionState.DISCONNECTED
         self.failed_connection_attempts += 1
+        self._current_check_interval = self.config.connectivity_check_interval  # Poll fast while recovering
         
         self.logger.warning(f"Connection failure #{self.failed_connection_attempts}")
         
         # Disable hotspot on connection loss if configured
-        if (self.config.mobile_hotspot_enabled and 
-            self.config.disable_hotspot_on_connection_loss and
-            self.hotspot_manager.get_hotspot_status()):
+        if (self.config.mobile_hotspot_enabled and self.config.disable_hotspot_on_connection_loss and
+                self.hotspot_manager.get_known_hotspot_status() is not False):
             self._toggle_mobile_hotspot(enable=False)
         
         # Escalate to MAC address reset if repeated failures
@@ -877,18 +1935,15 @@ class WifiAutoConnector:
     
     def _should_reset_mac_address(self) -> bool:
         """Determine if MAC address should be reset based on failure patterns"""
-        if not self.config.mac_spoofing_enabled:
-            return False
-        
-        if not self.mac_manager.is_mac_spoofing_available():
+        if not self._mac_spoofing_active:
             return False
         
         if self.failed_connection_attempts < self.config.connection_failures_before_mac_reset:
             return False
         
         # Enforce cooldown period between MAC resets
-        if self.last_mac_reset_timestamp:
-            time_since_last_reset = (datetime.now() - self.last_mac_reset_timestamp).total_seconds()
+        if self._last_mac_reset_monotonic is not None:
+            time_since_last_reset = time.monotonic() - self._last_mac_reset_monotonic
             if time_since_last_reset < self.config.mac_reset_cooldown_seconds:
                 return False
         
@@ -902,49 +1957,99 @@ class WifiAutoConnector:
             success = self.mac_manager.randomize_network_adapter_mac()
             if success:
                 self.failed_connection_attempts = 0
-                self.last_mac_reset_timestamp = datetime.now()
-                self.network_manager.invalidate_connectivity_cache()
+                self._last_mac_reset_monotonic = time.monotonic()
                 return True
         except MacAddressError as e:
             self.logger.error(f"MAC address reset failed: {e}")
-            # Apply cooldown even on failure to avoid rapid retry loops
-            time.sleep(self.config.mac_reset_cooldown_seconds)
+            # Apply cooldown even on failure to avoid rapid retry loops (cut short on shutdown)
+            self._wait_unless_stopped(self.config.mac_reset_cooldown_seconds)
         
         return False
     
+    def _resync_hotspot_state_if_due(self) -> None:
+        """Refresh the known hotspot state once the resync interval has elapsed"""
+        if not self.hotspot_manager.has_administrator_privileges():
+            return
+        
+        # A running toggle will report the new state itself
+        if self._pending_hotspot_toggle is not None:
+            return
+        
+        if (self._hotspot_state_synced_monotonic is None or
+                time.monotonic() - self._hotspot_state_synced_monotonic >= Constants.HOTSPOT_STATE_RESYNC_INTERVAL):
+            # Stale-while-revalidate: the refreshed state is acted on next cycle
+            self.hotspot_manager.get_hotspot_status()
+            self._hotspot_state_synced_monotonic = time.monotonic()
+    
     def _toggle_mobile_hotspot(self, enable: bool) -> None:
         """Toggle mobile hotspot state for internet connection sharing"""
         if not self.config.mobile_hotspot_enabled:
             return
         
-        self.connection_state = ConnectionState.HOTSPOT_MANAGING
+        # Already reported at startup - don't repeat the error every cycle
+        if not self.hotspot_manager.has_administrator_privileges():
+            return
+        
+        # Previous toggle still running - its result is reconciled on a later cycle
+        if self._pending_hotspot_toggle is not None:
+            return
+        
+        # Run the slow PowerShell/WinRT call in the background so connectivity checks aren't delayed
+        self._pending_hotspot_enable = enable
+        if enable:
+            self._pending_hotspot_toggle = self.hotspot_manager.enable_mobile_hotspot_async()
+        else:
+            self._pending_hotspot_toggle = self.hotspot_manager.disable_mobile_hotspot_async()
+    
+    def _collect_hotspot_toggle_result(self) -> None:
+        """Log the outcome of a finished background hotspot toggle"""
+        pending_toggle = self._pending_hotspot_toggle
+        if pending_toggle is None or not pending_toggle.done():
+            return
         
+        self._pending_hotspot_toggle = None
         try:
-            if enable:
-                self.hotspot_manager.enable_mobile_hotspot()
-                self.logger.info("Mobile hotspot activated - sharing WiFi connection")
-            else:
-                self.hotspot_manager.disable_mobile_hotspot()
-                self.logger.info("Mobile hotspot deactivated")
+            if pending_toggle.result():
+                if self._pending_hotspot_enable:
+                    self.logger.info("Mobile hotspot activated - sharing WiFi connection")
+                else:
+                    self.logger.info("Mobile hotspot deactivated")
         except HotspotError as e:
             self.logger.error(f"Mobile hotspot operation failed: {e}")
     
     def _execute_portal_authentication(self) -> None:
-        """Attempt captive portal authentication using browser automation"""
+        """Attempt captive portal authentication, directly over HTTP when configured, else via the browser"""
         self.connection_state = ConnectionState.RECOVERING
         
-        login_result = self.browser_manager.execute_captive_portal_login()
+        login_result = None
+        if self.config.portal_login_requests:
+            login_result = self.portal_client.execute_captive_portal_login()
+        
+        if login_result is not LoginResult.SUCCESS and self._browser_login_enabled:
+            if login_result is not None:
+                self.logger.warning("Falling back to browser automation for captive portal login")
+            login_result = self.browser_manager.execute_captive_portal_login()
         
         if login_result == LoginResult.SUCCESS:
             self.logger.info("Captive portal authentication completed")
-            self.network_manager.invalidate_connectivity_cache()
         else:
             self.logger.error(f"Captive portal authentication failed: {login_result.value}")
     
     def _wait_for_next_check(self) -> None:
         """Wait for the configured interval before next connectivity check"""
-        self.logger.info(f"Next connectivity check in {self.config.connectivity_check_interval} seconds...")
-        time.sleep(self.config.connectivity_check_interval)
+        self.logger.info(f"Next connectivity check in {self._current_check_interval} seconds...")
+        self._wait_unless_stopped(self._current_check_interval)
+    
+    def _wait_unless_stopped(self, duration: float) -> None:
+        """Sleep up to duration, returning early once shutdown is requested"""
+        # Short slices: on Windows (Python <= 3.13) Ctrl+C can't interrupt one long Event.wait,
+        # so the signal handler would otherwise only run when the full wait times out
+        deadline = time.monotonic() + duration
+        while not self._stop_event.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            self._stop_event.wait(min(remaining, Constants.SHUTDOWN_WAIT_SLICE))
 
 # ================================= MAIN EXECUTION =================================
 